@@ -4,7 +4,8 @@ Entry point for Facebook Ads MCP Server when run as a module.
 This allows running the server with: python -m facebook-ads-mcp-server
 """
 
-from server import main
-
 if __name__ == "__main__":
+    # Import lazily so merely importing the package (e.g. for metadata or
+    # tooling) doesn't pay the full server + fb_ads import cost.
+    from server import main
     main()
@@ -5,19 +5,100 @@ This module provides tools for creating and managing Facebook/Meta ads and creat
 including catalog-based Dynamic Product Ads (DPA), media creatives, and Advantage+ features.
 """
 
-import json
+from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlencode
 from typing import List, Optional, Dict, Any
 from .api import (
     FB_GRAPH_URL,
+    _dump,
     get_access_token,
     get_act_id,
     get_page_id,
     get_instagram_user_id,
     get_catalog_id,
     _make_graph_api_call,
-    _make_graph_api_post
+    _cached_graph_get,
+    _make_graph_api_post,
+    _make_graph_api_batch,
+    _prepare_params,
+    _redact_params
 )
 
+# Statuses accepted by the Graph API for ad updates; frozenset gives O(1)
+# membership checks in the validation paths below.
+_VALID_STATUSES = frozenset({"ACTIVE", "PAUSED", "ARCHIVED", "DELETED"})
+_VALID_STATUSES_MSG = ", ".join(sorted(_VALID_STATUSES))
+
+# Validation-failure responses serialized once at import so the early-return
+# paths allocate nothing per call.
+_ERR_NO_ACT_ID = _dump({
+    "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
+})
+_ERR_NO_AD_ID = _dump({"error": "No ad_id provided"})
+_ERR_NO_AD_IDS = _dump({"error": "No ad_ids provided"})
+_ERR_NO_ADSET_ID = _dump({"error": "No adset_id provided"})
+_ERR_NO_CAMPAIGN_ID = _dump({"error": "No campaign_id provided"})
+_ERR_NO_CREATIVE_ID = _dump({"error": "No creative_id provided"})
+_ERR_NO_CATALOG_ID = _dump({"error": "No catalog_id provided or configured"})
+_ERR_NO_PAGE_ID = _dump({"error": "No page_id provided or configured"})
+_ERR_NO_CREATIVE_NAME = _dump({"error": "No creative name provided"})
+_ERR_NO_AD_NAME = _dump({"error": "No ad name provided"})
+_ERR_NO_MESSAGE = _dump({"error": "No message provided for the ad creative"})
+_ERR_NO_STATUS = _dump({"error": "No status provided"})
+_ERR_NO_UPDATE_FIELDS = _dump({"error": "No fields to update provided"})
+
+# Default field selection for fetch_product_sets, encoded once at import
+_PRODUCT_SET_DEFAULT_FIELDS = 'id,name,product_count,filter'
+
+
+@dataclass(slots=True)
+class _LinkData:
+    """Slot-based builder for the object_story_spec link_data payload."""
+    message: str
+    link: Optional[str] = None
+    call_to_action: Optional[Dict[str, Any]] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"message": self.message}
+        if self.link is not None:
+            d["link"] = self.link
+        if self.call_to_action is not None:
+            d["call_to_action"] = self.call_to_action
+        return d
+
+
+@dataclass(slots=True)
+class _ObjectStorySpec:
+    """Slot-based builder for an ad creative object_story_spec."""
+    page_id: str
+    instagram_actor_id: Optional[str] = None
+    link_data: Optional[_LinkData] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        d: Dict[str, Any] = {"page_id": self.page_id}
+        if self.instagram_actor_id is not None:
+            d["instagram_actor_id"] = self.instagram_actor_id
+        if self.link_data is not None:
+            d["link_data"] = self.link_data.as_dict()
+        return d
+
+
+# Tools are typically called repeatedly with the same field selections and
+# status filters, so memoize their encoded forms. Callers pass tuples since
+# lru_cache needs hashable arguments.
+@lru_cache(maxsize=128)
+def _fields_csv(fields: tuple) -> str:
+    """Return the comma-separated encoding of a fields tuple."""
+    return ','.join(fields)
+
+
+@lru_cache(maxsize=128)
+def _status_json(effective_status: tuple) -> str:
+    """Return the compact JSON encoding of an effective_status tuple."""
+    # Request param, not a tool return: stays compact even in pretty mode
+    return _dump(list(effective_status), pretty=False)
+
 
 async def create_catalog_creative(
     name: str,
@@ -74,97 +155,84 @@ async def create_catalog_creative(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
-            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
+        return _ERR_NO_ACT_ID
 
     if not name:
-        return json.dumps({"error": "No creative name provided"}, indent=2)
+        return _ERR_NO_CREATIVE_NAME
 
     if not object_story_spec_link_data_message:
-        return json.dumps({"error": "No message provided for the ad creative"}, indent=2)
+        return _ERR_NO_MESSAGE
 
     # Use global config for page_id and instagram_user_id
     page_id = get_page_id()
     instagram_user_id = get_instagram_user_id()
 
     if not page_id:
-        return json.dumps({"error": "No page_id provided or configured"}, indent=2)
+        return _ERR_NO_PAGE_ID
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{act_id}/adcreatives"
 
-    # Build object_story_spec
-    object_story_spec = {
-        "page_id": page_id
-    }
-
-    if instagram_user_id:
-        object_story_spec["instagram_actor_id"] = instagram_user_id
-
-    # Build link_data
-    link_data = {
-        "message": object_story_spec_link_data_message
-    }
+    # Build link_data and object_story_spec via the slot-based builders,
+    # serializing to a dict only once at the API boundary
+    link_data = _LinkData(message=object_story_spec_link_data_message)
 
     if call_to_action_type:
-        link_data["call_to_action"] = {
-            "type": call_to_action_type
-        }
+        call_to_action: Dict[str, Any] = {"type": call_to_action_type}
         if link:
-            link_data["call_to_action"]["value"] = {"link": link}
+            call_to_action["value"] = {"link": link}
+        link_data.call_to_action = call_to_action
     elif link:
-        link_data["link"] = link
+        link_data.link = link
 
-    object_story_spec["link_data"] = link_data
+    object_story_spec = _ObjectStorySpec(
+        page_id=page_id,
+        instagram_actor_id=instagram_user_id or None,
+        link_data=link_data
+    )
 
     base_params = {
         "access_token": access_token,
         "name": name,
-        "object_story_spec": json.dumps(object_story_spec)
+        "object_story_spec": _dump(object_story_spec.as_dict(), pretty=False)
     }
 
     # Add product set ID if provided (classic DPA approach)
     if product_set_id:
         base_params["product_set_id"] = product_set_id
 
-    # Build degrees_of_freedom_spec for Advantage+ features
-    degrees_of_freedom_spec = {}
+    # Build creative_features_spec for Advantage+ features in one pass,
+    # binding the nested dict once instead of re-looking it up per feature.
+    creative_features_spec = {}
 
     if adv_text_optimizations is not None:
-        degrees_of_freedom_spec["creative_features_spec"] = {
-            "standard_enhancements": {
-                "enroll_status": "OPT_IN" if adv_text_optimizations else "OPT_OUT"
-            }
+        creative_features_spec["standard_enhancements"] = {
+            "enroll_status": "OPT_IN" if adv_text_optimizations else "OPT_OUT"
         }
 
     if adv_image_crop is not None:
-        if "creative_features_spec" not in degrees_of_freedom_spec:
-            degrees_of_freedom_spec["creative_features_spec"] = {}
-        degrees_of_freedom_spec["creative_features_spec"]["image_enhancements"] = {
+        creative_features_spec["image_enhancements"] = {
             "image_crop": {
                 "enroll_status": "OPT_IN" if adv_image_crop else "OPT_OUT"
             }
         }
 
     if adv_video_crop is not None:
-        if "creative_features_spec" not in degrees_of_freedom_spec:
-            degrees_of_freedom_spec["creative_features_spec"] = {}
-        degrees_of_freedom_spec["creative_features_spec"]["video_enhancements"] = {
+        creative_features_spec["video_enhancements"] = {
             "video_crop": {
                 "enroll_status": "OPT_IN" if adv_video_crop else "OPT_OUT"
             }
         }
 
     if adv_composite_media is not None:
-        if "creative_features_spec" not in degrees_of_freedom_spec:
-            degrees_of_freedom_spec["creative_features_spec"] = {}
-        degrees_of_freedom_spec["creative_features_spec"]["composite_media"] = {
+        creative_features_spec["composite_media"] = {
             "enroll_status": "OPT_IN" if adv_composite_media else "OPT_OUT"
         }
 
-    if degrees_of_freedom_spec:
-        base_params["degrees_of_freedom_spec"] = json.dumps(degrees_of_freedom_spec)
+    if creative_features_spec:
+        base_params["degrees_of_freedom_spec"] = _dump(
+            {"creative_features_spec": creative_features_spec}, pretty=False
+        )
 
     # Add image template if provided
     if adv_image_template:
@@ -172,18 +240,18 @@ async def create_catalog_creative(
 
     # Add advanced catalog feed spec if provided
     if adv_catalog_feed_spec:
-        base_params["catalog_feed_spec"] = json.dumps(adv_catalog_feed_spec)
+        base_params["catalog_feed_spec"] = _dump(adv_catalog_feed_spec, pretty=False)
 
     try:
         data = await _make_graph_api_post(url, base_params)
-        return json.dumps(data, indent=2)
+        return _dump(data)
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return _dump({
             "error": "Failed to create catalog creative",
             "details": error_msg,
-            "params_sent": {k: v for k, v in base_params.items() if 'token' not in k.lower()}
-        }, indent=2)
+            "params_sent": _redact_params(base_params)
+        })
 
 
 async def create_ad_with_catalog_creative(
@@ -205,18 +273,16 @@ async def create_ad_with_catalog_creative(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
-            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
+        return _ERR_NO_ACT_ID
 
     if not adset_id:
-        return json.dumps({"error": "No adset_id provided"}, indent=2)
+        return _ERR_NO_ADSET_ID
 
     if not creative_id:
-        return json.dumps({"error": "No creative_id provided"}, indent=2)
+        return _ERR_NO_CREATIVE_ID
 
     if not name:
-        return json.dumps({"error": "No ad name provided"}, indent=2)
+        return _ERR_NO_AD_NAME
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{act_id}/ads"
@@ -225,20 +291,20 @@ async def create_ad_with_catalog_creative(
         "access_token": access_token,
         "name": name,
         "adset_id": adset_id,
-        "creative": json.dumps({"creative_id": creative_id}),
+        "creative": _dump({"creative_id": creative_id}, pretty=False),
         "status": status
     }
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        return _dump(data)
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return _dump({
             "error": "Failed to create ad",
             "details": error_msg,
-            "params_sent": {k: v for k, v in params.items() if 'token' not in k.lower()}
-        }, indent=2)
+            "params_sent": _redact_params(params)
+        })
 
 
 async def fetch_product_sets(
@@ -257,30 +323,27 @@ async def fetch_product_sets(
     catalog_id = get_catalog_id()
 
     if not catalog_id:
-        return json.dumps({"error": "No catalog_id provided or configured"}, indent=2)
+        return _ERR_NO_CATALOG_ID
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{catalog_id}/product_sets"
 
-    # Default fields if none provided
-    if not fields:
-        fields = ['id', 'name', 'product_count', 'filter']
-
     params = {
         'access_token': access_token,
-        'fields': ','.join(fields),
+        'fields': _fields_csv(tuple(fields)) if fields else _PRODUCT_SET_DEFAULT_FIELDS,
         'limit': limit
     }
 
     try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
+        # Product sets rarely change; serve repeat reads from the TTL cache
+        data = await _cached_graph_get(url, params)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to fetch product sets",
             "details": str(e),
             "catalog_id": catalog_id
-        }, indent=2)
+        })
 
 
 async def edit_ad(
@@ -303,10 +366,10 @@ async def edit_ad(
         str: JSON string containing update result or error message.
     """
     if not ad_id:
-        return json.dumps({"error": "No ad_id provided"}, indent=2)
+        return _ERR_NO_AD_ID
 
     if not any([name, status, creative_id, adset_id]):
-        return json.dumps({"error": "No fields to update provided"}, indent=2)
+        return _ERR_NO_UPDATE_FIELDS
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{ad_id}"
@@ -316,26 +379,25 @@ async def edit_ad(
     if name:
         params["name"] = name
     if status:
-        valid_statuses = ["ACTIVE", "PAUSED", "ARCHIVED", "DELETED"]
-        if status not in valid_statuses:
-            return json.dumps({
-                "error": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
-            }, indent=2)
+        if status not in _VALID_STATUSES:
+            return _dump({
+                "error": f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}"
+            })
         params["status"] = status
     if creative_id:
-        params["creative"] = json.dumps({"creative_id": creative_id})
+        params["creative"] = _dump({"creative_id": creative_id}, pretty=False)
     if adset_id:
         params["adset_id"] = adset_id
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to edit ad",
             "details": str(e),
             "ad_id": ad_id
-        }, indent=2)
+        })
 
 
 async def bulk_update_status(
@@ -352,45 +414,50 @@ async def bulk_update_status(
         str: JSON string containing results for each ad.
     """
     if not ad_ids:
-        return json.dumps({"error": "No ad_ids provided"}, indent=2)
+        return _ERR_NO_AD_IDS
 
     if not status:
-        return json.dumps({"error": "No status provided"}, indent=2)
+        return _ERR_NO_STATUS
+
+    if status not in _VALID_STATUSES:
+        return _dump({
+            "error": f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}"
+        })
+
+    # One batched call (50 sub-requests per HTTP round-trip) instead of
+    # N separate POSTs; responses come back aligned with ad_ids.
+    body = urlencode({"status": status})
+    subrequests = [
+        {"method": "POST", "relative_url": ad_id, "body": body}
+        for ad_id in ad_ids
+    ]
+    responses = await _make_graph_api_batch(subrequests)
 
-    valid_statuses = ["ACTIVE", "PAUSED", "ARCHIVED", "DELETED"]
-    if status not in valid_statuses:
-        return json.dumps({
-            "error": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
-        }, indent=2)
-
-    access_token = get_access_token()
     results = []
-
-    for ad_id in ad_ids:
-        url = f"{FB_GRAPH_URL}/{ad_id}"
-        params = {
-            "access_token": access_token,
-            "status": status
-        }
-
-        try:
-            data = await _make_graph_api_post(url, params)
+    for ad_id, response in zip(ad_ids, responses):
+        if isinstance(response, dict) and 'error' in response:
             results.append({
                 "ad_id": ad_id,
-                "success": True,
-                "result": data
+                "success": False,
+                "error": response['error']
             })
-        except Exception as e:
+        elif response is None:
             results.append({
                 "ad_id": ad_id,
                 "success": False,
-                "error": str(e)
+                "error": "No response returned for this sub-request"
+            })
+        else:
+            results.append({
+                "ad_id": ad_id,
+                "success": True,
+                "result": response
             })
 
-    return json.dumps({
+    return _dump({
         "total": len(ad_ids),
         "results": results
-    }, indent=2)
+    })
 
 
 async def get_ad_by_id(
@@ -418,27 +485,123 @@ async def get_ad_by_id(
         str: JSON string containing the requested ad information or error message.
     """
     if not ad_id:
-        return json.dumps({"error": "No ad_id provided"}, indent=2)
+        return _ERR_NO_AD_ID
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{ad_id}"
     params = {'access_token': access_token}
 
     if fields:
-        params['fields'] = ','.join(fields)
+        params['fields'] = _fields_csv(tuple(fields))
 
     if date_format:
         params['date_format'] = date_format
 
     try:
         data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to get ad",
             "details": str(e),
             "ad_id": ad_id
-        }, indent=2)
+        })
+
+
+async def get_ads_by_ids(
+    ad_ids: List[str],
+    fields: Optional[List[str]] = None,
+    date_format: Optional[str] = None
+) -> str:
+    """Retrieves detailed information about multiple Facebook ads by their IDs.
+
+    Uses the Graph API `?ids=` multi-read, so all requested ads come back
+    in a single API call instead of one call per ad.
+
+    Args:
+        ad_ids (List[str]): A list of ad IDs to retrieve information for.
+        fields (Optional[List[str]]): A list of specific fields to retrieve for each ad.
+        date_format (Optional[str]): Format for date responses. Options:
+            - 'U': Unix timestamp (seconds since epoch)
+            - 'Y-m-d H:i:s': MySQL datetime format
+            - None: ISO 8601 format (default)
+
+    Returns:
+        str: JSON string mapping ad IDs to their details, or an error message.
+    """
+    if not ad_ids:
+        return _ERR_NO_AD_IDS
+
+    access_token = get_access_token()
+    url = f"{FB_GRAPH_URL}/"
+    params = {
+        'access_token': access_token,
+        'ids': ','.join(ad_ids)
+    }
+
+    if fields:
+        params['fields'] = _fields_csv(tuple(fields))
+
+    if date_format:
+        params['date_format'] = date_format
+
+    try:
+        data = await _make_graph_api_call(url, params)
+        return _dump(data)
+    except Exception as e:
+        return _dump({
+            "error": "Failed to get ads",
+            "details": str(e),
+            "ad_ids": ad_ids
+        })
+
+
+async def _get_ads_edge(
+    parent_id: str,
+    error_label: str,
+    error_key: str,
+    fields: Optional[List[str]] = None,
+    filtering: Optional[List[dict]] = None,
+    limit: Optional[int] = 25,
+    after: Optional[str] = None,
+    before: Optional[str] = None,
+    effective_status: Optional[List[str]] = None,
+    updated_since: Optional[int] = None,
+    date_format: Optional[str] = None,
+    # Bound at definition time so the hot path uses LOAD_FAST instead of
+    # repeated global lookups; callers never pass these.
+    _call=_make_graph_api_call,
+    _url_base=FB_GRAPH_URL
+) -> str:
+    """Fetch the /ads edge of an account, campaign or ad set.
+
+    Shared implementation behind the get_ads_by_* tools: the three edges
+    take identical query params and only differ in the parent node and the
+    error payload they report.
+    """
+    access_token = get_access_token()
+    url = f"{_url_base}/{parent_id}/ads"
+    params = _prepare_params(
+        {'access_token': access_token},
+        fields=_fields_csv(tuple(fields)) if fields else None,
+        filtering=filtering,
+        limit=limit,
+        after=after,
+        before=before,
+        effective_status=_status_json(tuple(effective_status)) if effective_status else None,
+        updated_since=updated_since,
+        date_format=date_format
+    )
+
+    try:
+        data = await _call(url, params)
+        return _dump(data)
+    except Exception as e:
+        return _dump({
+            "error": f"Failed to get ads by {error_label}",
+            "details": str(e),
+            error_key: parent_id
+        })
 
 
 async def get_ads_by_adaccount(
@@ -468,47 +631,14 @@ async def get_ads_by_adaccount(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
-            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
-
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/ads"
-    params = {'access_token': access_token}
+        return _ERR_NO_ACT_ID
 
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
-
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
-
-    if updated_since:
-        params['updated_since'] = updated_since
-
-    if date_format:
-        params['date_format'] = date_format
-
-    try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return json.dumps({
-            "error": "Failed to get ads by ad account",
-            "details": str(e),
-            "act_id": act_id
-        }, indent=2)
+    return await _get_ads_edge(
+        act_id, "ad account", "act_id",
+        fields=fields, filtering=filtering, limit=limit,
+        after=after, before=before, effective_status=effective_status,
+        updated_since=updated_since, date_format=date_format
+    )
 
 
 async def get_ads_by_campaign(
@@ -537,42 +667,14 @@ async def get_ads_by_campaign(
         str: JSON string containing the requested ads or error message.
     """
     if not campaign_id:
-        return json.dumps({"error": "No campaign_id provided"}, indent=2)
+        return _ERR_NO_CAMPAIGN_ID
 
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{campaign_id}/ads"
-    params = {'access_token': access_token}
-
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
-
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
-
-    if date_format:
-        params['date_format'] = date_format
-
-    try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return json.dumps({
-            "error": "Failed to get ads by campaign",
-            "details": str(e),
-            "campaign_id": campaign_id
-        }, indent=2)
+    return await _get_ads_edge(
+        campaign_id, "campaign", "campaign_id",
+        fields=fields, filtering=filtering, limit=limit,
+        after=after, before=before, effective_status=effective_status,
+        date_format=date_format
+    )
 
 
 async def get_ads_by_adset(
@@ -601,42 +703,14 @@ async def get_ads_by_adset(
         str: JSON string containing the requested ads or error message.
     """
     if not adset_id:
-        return json.dumps({"error": "No adset_id provided"}, indent=2)
+        return _ERR_NO_ADSET_ID
 
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{adset_id}/ads"
-    params = {'access_token': access_token}
-
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
-
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
-
-    if date_format:
-        params['date_format'] = date_format
-
-    try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
-    except Exception as e:
-        return json.dumps({
-            "error": "Failed to get ads by ad set",
-            "details": str(e),
-            "adset_id": adset_id
-        }, indent=2)
+    return await _get_ads_edge(
+        adset_id, "ad set", "adset_id",
+        fields=fields, filtering=filtering, limit=limit,
+        after=after, before=before, effective_status=effective_status,
+        date_format=date_format
+    )
 
 
 async def get_ad_creative_by_id(
@@ -663,14 +737,14 @@ async def get_ad_creative_by_id(
         str: JSON string containing the requested creative information or error message.
     """
     if not creative_id:
-        return json.dumps({"error": "No creative_id provided"}, indent=2)
+        return _ERR_NO_CREATIVE_ID
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{creative_id}"
     params = {'access_token': access_token}
 
     if fields:
-        params['fields'] = ','.join(fields)
+        params['fields'] = _fields_csv(tuple(fields))
 
     if thumbnail_width:
         params['thumbnail_width'] = thumbnail_width
@@ -679,11 +753,12 @@ async def get_ad_creative_by_id(
         params['thumbnail_height'] = thumbnail_height
 
     try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
+        # Creatives are immutable once created; serve repeat reads from cache
+        data = await _cached_graph_get(url, params)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to get ad creative",
             "details": str(e),
             "creative_id": creative_id
-        }, indent=2)
+        })
@@ -5,33 +5,160 @@ This module provides tools for creating and managing Facebook/Meta ad sets,
 including advanced targeting, budget optimization, and frequency capping.
 """
 
-import json
+import asyncio
+from urllib.parse import urlencode
 from typing import List, Optional, Dict, Any, Union
 from .api import (
     FB_GRAPH_URL,
+    GRAPH_BATCH_LIMIT,
+    _dump,
+    _loads,
     get_access_token,
     get_act_id,
     get_pixel_id,
     get_website_domain,
     _make_graph_api_call,
+    _encode_params,
+    _cached_graph_get,
+    _invalidate_read_cache,
     _make_graph_api_post,
-    _prepare_params
+    _make_graph_api_batch,
+    _redact_params
 )
 
 
+# Lean default projection for the list endpoints: requesting everything
+# Graph returns by default pulls heavy blobs (full targeting specs etc.)
+# that dominate response size. Callers pass '__all__' to restore the
+# API-default field set.
+_DEFAULT_LIST_FIELDS = (
+    'id,name,campaign_id,effective_status,daily_budget,lifetime_budget,'
+    'optimization_goal,bid_strategy'
+)
+
+# Optimization goals that require conversion-specific details
+# (pixel_id, custom_event_type); built once at import
+_CONVERSION_GOALS = frozenset({
+    "OFFSITE_CONVERSIONS",
+    "VALUE",
+    "APP_INSTALLS",
+    "APP_INSTALLS_AND_OFFSITE_CONVERSIONS",
+    "IN_APP_VALUE",
+    "ADVERTISER_SILOED_VALUE",
+    "MESSAGING_PURCHASE_CONVERSION",
+    "MESSAGING_APPOINTMENT_CONVERSION",
+})
+
+
 def _requires_conversion_details(optimization_goal: str) -> bool:
     """Check if an optimization goal requires conversion-specific details (pixel_id, custom_event_type)."""
-    conversion_goals = {
-        "OFFSITE_CONVERSIONS",
-        "VALUE",
-        "APP_INSTALLS",
-        "APP_INSTALLS_AND_OFFSITE_CONVERSIONS",
-        "IN_APP_VALUE",
-        "ADVERTISER_SILOED_VALUE",
-        "MESSAGING_PURCHASE_CONVERSION",
-        "MESSAGING_APPOINTMENT_CONVERSION",
+    return optimization_goal in _CONVERSION_GOALS
+
+
+def _build_create_adset_params(
+    campaign_id: str,
+    name: str,
+    optimization_goal: str,
+    billing_event: str,
+    custom_event_type: Optional[str] = None,
+    status: str = "PAUSED",
+    daily_budget: Optional[str] = None,
+    lifetime_budget: Optional[str] = None,
+    targeting: Union[str, Dict[str, Any], None] = None,
+    bid_amount: Optional[str] = None,
+    bid_strategy: Optional[str] = None,
+    roas_average_floor: Optional[str] = None,
+    start_time: Optional[str] = None,
+    end_time: Optional[str] = None,
+    destination_type: Optional[str] = "WEBSITE"
+):
+    """Validate and build the POST params for a single ad set creation.
+
+    Shared by create_adset and create_adsets_bulk. Returns a tuple of
+    (params, error): on success params is the request dict (without the
+    access token) and error is None; on validation failure params is None
+    and error is an error payload dict.
+    """
+    # Validate required parameters
+    if not all([campaign_id, name]):
+        return None, {"error": "campaign_id and name are required"}
+
+    if not optimization_goal or not billing_event:
+        return None, {"error": "optimization_goal and billing_event are required"}
+
+    # Check conversion goal requirements; fetch the config-backed values
+    # once and reuse them when building promoted_object below
+    needs_conversion_details = _requires_conversion_details(optimization_goal)
+    if needs_conversion_details:
+        # Cheapest pure-argument check first, then the config-backed lookups
+        if not custom_event_type:
+            return None, {"error": "custom_event_type is required for conversion goals (e.g., PURCHASE, VIEW_CONTENT)"}
+
+        pixel_id = get_pixel_id()
+        if not pixel_id:
+            return None, {"error": "pixel_id is required for conversion goals. Configure with --pixel-id"}
+
+        website_domain = get_website_domain()
+        if not website_domain:
+            return None, {"error": "website_domain is required for conversion goals. Configure with --website-domain"}
+
+    # Validate bid strategy requirements
+    if bid_strategy == "LOWEST_COST_WITH_MIN_ROAS" and not roas_average_floor:
+        return None, {"error": "roas_average_floor is required for LOWEST_COST_WITH_MIN_ROAS strategy"}
+
+    # Basic targeting is required if not provided
+    if not targeting:
+        targeting = {
+            "age_min": 18,
+            "age_max": 65,
+            "geo_locations": {"countries": ["BR"]},
+            "targeting_automation": {"advantage_audience": 1}
+        }
+
+    # Parse targeting if provided as string
+    if isinstance(targeting, str):
+        try:
+            targeting = _loads(targeting)
+        except ValueError as exc:
+            return None, {
+                "error": "targeting was sent as string but is not valid JSON",
+                "details": str(exc),
+                "received": targeting,
+            }
+
+    # Build the dict in a single literal (conversion-specific keys attached
+    # via conditional unpacking) instead of growing it key by key
+    base_params = {
+        "name": name,
+        "campaign_id": campaign_id,
+        "status": status,
+        "optimization_goal": optimization_goal,
+        "billing_event": billing_event,
+        **({
+            "promoted_object": {
+                "pixel_id": pixel_id,
+                "custom_event_type": custom_event_type.upper()
+            },
+            "destination_type": destination_type,
+            "conversion_domain": website_domain,
+        } if needs_conversion_details else {})
+    }
+
+    # Optional params only need a None filter here — nested values are
+    # JSON-encoded at the HTTP boundary, so the generic _prepare_params
+    # machinery would be pure overhead
+    optional = {
+        "targeting": targeting,
+        "daily_budget": daily_budget,
+        "lifetime_budget": lifetime_budget,
+        "bid_amount": bid_amount,
+        "bid_strategy": bid_strategy,
+        "start_time": start_time,
+        "end_time": end_time,
+        "roas_average_floor": roas_average_floor
     }
-    return optimization_goal in conversion_goals
+    base_params.update((k, v) for k, v in optional.items() if v is not None)
+    return base_params, None
 
 
 async def create_adset(
@@ -162,98 +289,106 @@ async def create_adset(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
+        return _dump({
             "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
-
-    # Validate required parameters
-    if not all([campaign_id, name]):
-        return json.dumps({"error": "campaign_id and name are required"}, indent=2)
-
-    if not optimization_goal or not billing_event:
-        return json.dumps({"error": "optimization_goal and billing_event are required"}, indent=2)
-
-    # Check conversion goal requirements
-    if _requires_conversion_details(optimization_goal):
-        pixel_id = get_pixel_id()
-        website_domain = get_website_domain()
-
-        if not pixel_id:
-            return json.dumps({"error": "pixel_id is required for conversion goals. Configure with --pixel-id"}, indent=2)
-
-        if not custom_event_type:
-            return json.dumps({"error": "custom_event_type is required for conversion goals (e.g., PURCHASE, VIEW_CONTENT)"}, indent=2)
-
-        if not website_domain:
-            return json.dumps({"error": "website_domain is required for conversion goals. Configure with --website-domain"}, indent=2)
-
-    # Validate bid strategy requirements
-    if bid_strategy == "LOWEST_COST_WITH_MIN_ROAS" and not roas_average_floor:
-        return json.dumps({"error": "roas_average_floor is required for LOWEST_COST_WITH_MIN_ROAS strategy"}, indent=2)
-
-    # Basic targeting is required if not provided
-    if not targeting:
-        targeting = {
-            "age_min": 18,
-            "age_max": 65,
-            "geo_locations": {"countries": ["BR"]},
-            "targeting_automation": {"advantage_audience": 1}
-        }
-
-    # Parse targeting if provided as string
-    if isinstance(targeting, str):
-        try:
-            targeting = json.loads(targeting)
-        except json.JSONDecodeError as exc:
-            return json.dumps({
-                "error": "targeting was sent as string but is not valid JSON",
-                "details": str(exc),
-                "received": targeting,
-            }, indent=2)
-
-    # Build base parameters
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/adsets"
-
-    base_params = {
-        "access_token": access_token,
-        "name": name,
-        "campaign_id": campaign_id,
-        "status": status,
-        "optimization_goal": optimization_goal,
-        "billing_event": billing_event
-    }
-
-    # Add conversion-specific parameters
-    if _requires_conversion_details(optimization_goal):
-        promoted_object = {"pixel_id": get_pixel_id()}
-        promoted_object["custom_event_type"] = custom_event_type.upper()
-        base_params["promoted_object"] = json.dumps(promoted_object)
-        base_params["destination_type"] = destination_type
-        base_params["conversion_domain"] = get_website_domain()
-
-    # Prepare final parameters
-    params = _prepare_params(
-        base_params,
-        targeting=targeting,
+        })
+
+    params, error = _build_create_adset_params(
+        campaign_id=campaign_id,
+        name=name,
+        optimization_goal=optimization_goal,
+        billing_event=billing_event,
+        custom_event_type=custom_event_type,
+        status=status,
         daily_budget=daily_budget,
         lifetime_budget=lifetime_budget,
+        targeting=targeting,
         bid_amount=bid_amount,
         bid_strategy=bid_strategy,
+        roas_average_floor=roas_average_floor,
         start_time=start_time,
         end_time=end_time,
-        roas_average_floor=roas_average_floor
+        destination_type=destination_type
     )
+    if error:
+        return _dump(error)
+
+    params["access_token"] = get_access_token()
+    url = f"{FB_GRAPH_URL}/{act_id}/adsets"
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to create ad set",
             "details": str(e),
-            "params_sent": {k: v for k, v in params.items() if 'token' not in k.lower()}
-        }, indent=2)
+            "params_sent": _redact_params(params)
+        })
+
+
+async def create_adsets_bulk(adsets: List[Dict[str, Any]]) -> str:
+    """Create multiple ad sets in a single Graph API batch call.
+
+    Each entry in `adsets` is a dict of create_adset keyword arguments
+    (campaign_id, name, optimization_goal, billing_event, plus any of the
+    optional parameters). All entries are validated up-front, then the
+    valid ones are sent as sub-requests of one batched POST instead of one
+    HTTP round-trip per ad set.
+
+    Args:
+        adsets (List[Dict[str, Any]]): Ad set specifications, one dict per
+            ad set, using the same keys as create_adset.
+
+    Returns:
+        str: JSON string with a per-ad-set result list (aligned with the
+        input order) and a total count.
+    """
+    act_id = get_act_id()
+    if not act_id:
+        return _dump({
+            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
+        })
+
+    if not adsets:
+        return _dump({"error": "No adsets provided"})
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(adsets)
+    subrequests = []
+    subrequest_indices = []
+
+    for index, spec in enumerate(adsets):
+        try:
+            params, error = _build_create_adset_params(**spec)
+        except TypeError as exc:
+            params, error = None, {"error": f"Invalid ad set specification: {exc}"}
+
+        if error:
+            results[index] = {"index": index, "success": False, "error": error}
+            continue
+
+        subrequests.append({
+            "method": "POST",
+            "relative_url": f"{act_id}/adsets",
+            "body": urlencode(_encode_params(params))
+        })
+        subrequest_indices.append(index)
+
+    if subrequests:
+        responses = await _make_graph_api_batch(subrequests)
+        for index, response in zip(subrequest_indices, responses):
+            if isinstance(response, dict) and 'error' in response:
+                results[index] = {"index": index, "success": False, "error": response['error']}
+            elif response is None:
+                results[index] = {
+                    "index": index,
+                    "success": False,
+                    "error": "No response returned for this sub-request"
+                }
+            else:
+                results[index] = {"index": index, "success": True, "result": response}
+
+    return _dump({"total": len(adsets), "results": results})
 
 
 async def update_adset(
@@ -299,12 +434,12 @@ async def update_adset(
         str: JSON string with update result or error details
     """
     if not adset_id:
-        return json.dumps({"error": "No ad set ID provided"}, indent=2)
+        return _dump({"error": "No ad set ID provided"})
 
     changes = {}
 
     if frequency_control_specs is not None:
-        changes['frequency_control_specs'] = json.dumps(frequency_control_specs)
+        changes['frequency_control_specs'] = frequency_control_specs
 
     if bid_strategy is not None:
         changes['bid_strategy'] = bid_strategy
@@ -319,7 +454,9 @@ async def update_adset(
         changes['optimization_goal'] = optimization_goal
 
     if targeting is not None:
-        # Get current ad set details to preserve existing targeting settings
+        # Get current ad set details to preserve existing targeting settings.
+        # Served through the TTL read cache so repeated partial updates
+        # (e.g. toggling advantage_audience) skip the extra GET round-trip.
         access_token = get_access_token()
         details_url = f"{FB_GRAPH_URL}/{adset_id}"
         details_params = {
@@ -327,7 +464,7 @@ async def update_adset(
             "fields": "targeting"
         }
         try:
-            current_details = await _make_graph_api_call(details_url, details_params)
+            current_details = await _cached_graph_get(details_url, details_params)
             current_targeting = current_details.get('targeting', {})
 
             if 'targeting_automation' in targeting and len(targeting) == 1:
@@ -335,25 +472,25 @@ async def update_adset(
                 if current_targeting:
                     merged_targeting = current_targeting.copy()
                     merged_targeting['targeting_automation'] = targeting['targeting_automation']
-                    changes['targeting'] = json.dumps(merged_targeting)
+                    changes['targeting'] = merged_targeting
                 else:
                     # If there's no existing targeting, create a basic one
                     basic_targeting = {
                         'targeting_automation': targeting['targeting_automation'],
                         'geo_locations': {'countries': ['BR']}
                     }
-                    changes['targeting'] = json.dumps(basic_targeting)
+                    changes['targeting'] = basic_targeting
             else:
                 # Full targeting replacement
-                changes['targeting'] = json.dumps(targeting)
+                changes['targeting'] = targeting
         except Exception as e:
-            return json.dumps({
+            return _dump({
                 "error": "Failed to fetch current targeting",
                 "details": str(e)
-            }, indent=2)
+            })
 
     if not changes:
-        return json.dumps({"error": "No update parameters provided"}, indent=2)
+        return _dump({"error": "No update parameters provided"})
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{adset_id}"
@@ -365,13 +502,16 @@ async def update_adset(
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        # The ad set just changed; drop any cached reads that include it
+        # (targeting snapshot, by-id fetches, ids= multi-reads)
+        _invalidate_read_cache(adset_id)
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to update ad set",
             "details": str(e),
             "adset_id": adset_id
-        }, indent=2)
+        })
 
 
 async def get_adset_by_id(
@@ -414,7 +554,9 @@ async def get_adset_by_id(
     if date_format:
         params['date_format'] = date_format
 
-    return await _make_graph_api_call(url, params)
+    # Bursty dashboard reads of the same ad set hit the TTL cache;
+    # update_adset invalidates affected entries on success
+    return await _cached_graph_get(url, params)
 
 
 async def get_adsets_by_ids(
@@ -449,38 +591,135 @@ async def get_adsets_by_ids(
     """
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/"
-    params = {
-        'access_token': access_token,
-        'ids': ','.join(adset_ids)
-    }
+    base_params = {'access_token': access_token}
 
     if fields:
+        base_params['fields'] = ','.join(fields)
+
+    if date_format:
+        base_params['date_format'] = date_format
+
+    # Graph rejects ids= lists past ~50 entries; split into chunks fetched
+    # concurrently and merge, so large batches cost max(chunk latencies)
+    # instead of failing or serializing.
+    chunks = [
+        adset_ids[i:i + GRAPH_BATCH_LIMIT]
+        for i in range(0, len(adset_ids), GRAPH_BATCH_LIMIT)
+    ]
+
+    if len(chunks) == 1:
+        return await _cached_graph_get(url, {**base_params, 'ids': ','.join(chunks[0])})
+
+    results = await asyncio.gather(*(
+        _cached_graph_get(url, {**base_params, 'ids': ','.join(chunk)})
+        for chunk in chunks
+    ))
+    return {k: v for chunk_result in results for k, v in chunk_result.items()}
+
+
+def _build_adset_list_params(
+    fields: Optional[List[str]],
+    filtering: Optional[List[dict]],
+    limit: Optional[int],
+    after: Optional[str],
+    before: Optional[str],
+    date_preset: Optional[str],
+    time_range: Optional[Dict[str, str]],
+    updated_since: Optional[int],
+    effective_status: Optional[List[str]],
+    date_format: Optional[str]
+) -> Dict[str, Any]:
+    """Build the query params shared by the ad set list endpoints.
+
+    When no fields are requested, a lean default projection is used to keep
+    list responses small; pass '__all__' to get the Graph API default set.
+    """
+    params: Dict[str, Any] = {'access_token': get_access_token()}
+
+    if fields is None:
+        params['fields'] = _DEFAULT_LIST_FIELDS
+    elif fields != '__all__' and fields != ['__all__']:
         params['fields'] = ','.join(fields)
 
+    if filtering:
+        params['filtering'] = filtering
+
+    if limit is not None:
+        params['limit'] = limit
+
+    if after:
+        params['after'] = after
+
+    if before:
+        params['before'] = before
+
+    if date_preset:
+        params['date_preset'] = date_preset
+
+    if time_range:
+        params['time_range'] = time_range
+
+    if updated_since:
+        params['updated_since'] = updated_since
+
+    if effective_status:
+        params['effective_status'] = effective_status
+
     if date_format:
         params['date_format'] = date_format
 
-    return await _make_graph_api_call(url, params)
+    return params
+
+
+async def _fetch_all_pages(url: str, params: Dict[str, Any], max_pages: int) -> Dict:
+    """Walk cursor pagination for a list endpoint, merging the data lists.
+
+    Each page's 'after' cursor is only known once that page arrives, so
+    the walk is sequential; the caller compensates by requesting the Graph
+    maximum of 100 rows per page. Stops after max_pages or when no next
+    cursor remains.
+    """
+    params = dict(params)
+    params.setdefault('limit', 100)
+
+    merged: List[Any] = []
+    page = None
+    for _ in range(max_pages):
+        page = await _make_graph_api_call(url, params)
+        merged.extend(page.get('data', []))
+        after = page.get('paging', {}).get('cursors', {}).get('after')
+        if not after or 'next' not in page.get('paging', {}):
+            break
+        params['after'] = after
+
+    result = {'data': merged}
+    if page and 'paging' in page:
+        result['paging'] = page['paging']
+    return result
 
 
 async def get_adsets_by_adaccount(
     fields: Optional[List[str]] = None,
     filtering: Optional[List[dict]] = None,
-    limit: Optional[int] = 25,
+    limit: Optional[int] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
     date_preset: Optional[str] = None,
     time_range: Optional[Dict[str, str]] = None,
     updated_since: Optional[int] = None,
     effective_status: Optional[List[str]] = None,
-    date_format: Optional[str] = None
+    date_format: Optional[str] = None,
+    auto_paginate: bool = False,
+    max_pages: int = 10
 ) -> Dict:
     """Retrieves ad sets from a specific Facebook ad account.
 
     Args:
-        fields (Optional[List[str]]): Specific fields to retrieve
+        fields (Optional[List[str]]): Specific fields to retrieve. Defaults to a
+            lean preset; pass '__all__' for the Graph API default field set
         filtering (Optional[List[dict]]): Filter objects with 'field', 'operator', 'value'
-        limit (Optional[int]): Maximum ad sets per page (default: 25, max: 100)
+        limit (Optional[int]): Maximum ad sets per page (max: 100). Defaults to
+            25 for single-page reads and 100 when auto_paginate is set
         after (Optional[str]): Pagination cursor for next page
         before (Optional[str]): Pagination cursor for previous page
         date_preset (Optional[str]): Predefined date range
@@ -488,6 +727,9 @@ async def get_adsets_by_adaccount(
         updated_since (Optional[int]): Unix timestamp
         effective_status (Optional[List[str]]): Filter by status
         date_format (Optional[str]): Date format ('U', 'Y-m-d H:i:s', or None)
+        auto_paginate (bool): Follow pagination cursors and merge all pages
+            (up to max_pages) instead of returning just the first page
+        max_pages (int): Page cap when auto_paginate is set (default: 10)
 
     Returns:
         Dict: Dictionary with 'data' list and 'paging' info
@@ -507,40 +749,16 @@ async def get_adsets_by_adaccount(
             "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
         )
 
-    access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{act_id}/adsets"
-    params = {'access_token': access_token}
-
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
-
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if date_preset:
-        params['date_preset'] = date_preset
-
-    if time_range:
-        params['time_range'] = json.dumps(time_range)
-
-    if updated_since:
-        params['updated_since'] = updated_since
-
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
-
-    if date_format:
-        params['date_format'] = date_format
+    params = _build_adset_list_params(
+        fields, filtering, limit, after, before, date_preset,
+        time_range, updated_since, effective_status, date_format
+    )
 
+    if auto_paginate:
+        # The walker defaults unset limits to the Graph maximum of 100
+        return await _fetch_all_pages(url, params, max_pages)
+    params.setdefault('limit', 25)
     return await _make_graph_api_call(url, params)
 
 
@@ -548,22 +766,26 @@ async def get_adsets_by_campaign(
     campaign_id: str,
     fields: Optional[List[str]] = None,
     filtering: Optional[List[dict]] = None,
-    limit: Optional[int] = 25,
+    limit: Optional[int] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
     date_preset: Optional[str] = None,
     time_range: Optional[Dict[str, str]] = None,
     updated_since: Optional[int] = None,
     effective_status: Optional[List[str]] = None,
-    date_format: Optional[str] = None
+    date_format: Optional[str] = None,
+    auto_paginate: bool = False,
+    max_pages: int = 10
 ) -> Dict:
     """Retrieves ad sets from a specific campaign.
 
     Args:
         campaign_id (str): Campaign ID
-        fields (Optional[List[str]]): Specific fields to retrieve
+        fields (Optional[List[str]]): Specific fields to retrieve. Defaults to a
+            lean preset; pass '__all__' for the Graph API default field set
         filtering (Optional[List[dict]]): Filter objects
-        limit (Optional[int]): Maximum ad sets per page
+        limit (Optional[int]): Maximum ad sets per page. Defaults to 25 for
+            single-page reads and 100 when auto_paginate is set
         after (Optional[str]): Pagination cursor
         before (Optional[str]): Pagination cursor
         date_preset (Optional[str]): Predefined date range
@@ -571,6 +793,9 @@ async def get_adsets_by_campaign(
         updated_since (Optional[int]): Unix timestamp
         effective_status (Optional[List[str]]): Filter by status
         date_format (Optional[str]): Date format
+        auto_paginate (bool): Follow pagination cursors and merge all pages
+            (up to max_pages) instead of returning just the first page
+        max_pages (int): Page cap when auto_paginate is set (default: 10)
 
     Returns:
         Dict: Dictionary with 'data' list and 'paging' info
@@ -584,38 +809,14 @@ async def get_adsets_by_campaign(
         )
         ```
     """
-    access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{campaign_id}/adsets"
-    params = {'access_token': access_token}
-
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
-
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if date_preset:
-        params['date_preset'] = date_preset
-
-    if time_range:
-        params['time_range'] = json.dumps(time_range)
-
-    if updated_since:
-        params['updated_since'] = updated_since
-
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
-
-    if date_format:
-        params['date_format'] = date_format
+    params = _build_adset_list_params(
+        fields, filtering, limit, after, before, date_preset,
+        time_range, updated_since, effective_status, date_format
+    )
 
+    if auto_paginate:
+        # The walker defaults unset limits to the Graph maximum of 100
+        return await _fetch_all_pages(url, params, max_pages)
+    params.setdefault('limit', 25)
     return await _make_graph_api_call(url, params)
@@ -5,19 +5,86 @@ This module provides async HTTP clients, parameter builders, and
 global configuration management for all Facebook Ads tools.
 """
 
+import argparse
+import asyncio
+import atexit
 import json
-import sys
+import os
+import random
+import time
 import logging
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
+from urllib.parse import urlencode
 import httpx
 
 # Configure logging to stderr (stdout must be reserved for JSON-RPC)
 logger = logging.getLogger(__name__)
 
 
+# --- JSON serialization helpers ---
+# orjson is a C-implemented encoder/decoder that is several times faster than
+# stdlib json on the large Graph API payloads these tools shuttle around.
+# Fall back to stdlib json so the server still runs without the wheel.
+# Payloads stay plain dicts end to end: tool results are serialized straight
+# back to JSON for the MCP client, so typed decode targets (msgspec.Struct
+# and friends) would add a schema to maintain for fields Graph changes
+# freely, only to be flattened again on output.
+
+# Tool output is read by programs, so it is compact by default; set
+# FB_ADS_PRETTY_JSON=1 to indent it for human debugging sessions.
+_PRETTY_JSON = os.environ.get("FB_ADS_PRETTY_JSON") == "1"
+
+try:
+    import orjson
+
+    def _dump(obj: Any, pretty: Optional[bool] = None) -> str:
+        """Serialize an object to a JSON string (orjson-backed)."""
+        if pretty is None:
+            pretty = _PRETTY_JSON
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+
+    def _loads(data) -> Any:
+        """Deserialize JSON from str/bytes (orjson-backed)."""
+        return orjson.loads(data)
+
+except ImportError:
+    def _dump(obj: Any, pretty: Optional[bool] = None) -> str:
+        """Serialize an object to a JSON string (stdlib fallback)."""
+        if pretty is None:
+            pretty = _PRETTY_JSON
+        return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
+
+    def _loads(data) -> Any:
+        """Deserialize JSON from str/bytes (stdlib fallback)."""
+        return json.loads(data)
+
+
+# Bodies above this size are decoded in a worker thread; below it the
+# thread handoff costs more than the parse
+_PARSE_OFFLOAD_BYTES = 64 * 1024
+
+
+async def _loads_async(content: bytes) -> Any:
+    """Decode a response body, offloading large ones to a worker thread.
+
+    The parser holds the GIL throughout, so this is not parallelism: the
+    win is that the event loop thread gets preempted and can keep
+    servicing other in-flight calls instead of stalling for the tens of
+    milliseconds a multi-megabyte insights payload takes to decode. For
+    bodies near the threshold the thread handoff roughly cancels out,
+    which is why small ones parse inline.
+    """
+    if len(content) > _PARSE_OFFLOAD_BYTES:
+        return await asyncio.to_thread(_loads, content)
+    return _loads(content)
+
+
 # --- Constants ---
 FB_API_VERSION = "v22.0"
 FB_GRAPH_URL = f"https://graph.facebook.com/{FB_API_VERSION}"
+GRAPH_BATCH_LIMIT = 50  # Max sub-requests per Graph API batch call
 DEFAULT_AD_ACCOUNT_FIELDS = [
     'name', 'business_name', 'age', 'account_status', 'balance',
     'amount_spent', 'attribution_spec', 'account_id', 'business',
@@ -27,15 +94,20 @@ DEFAULT_AD_ACCOUNT_FIELDS = [
 
 
 # --- Global State ---
-_CONFIG = {
-    'access_token': None,
-    'act_id': None,
-    'pixel_id': None,
-    'page_id': None,
-    'instagram_user_id': None,
-    'catalog_id': None,
-    'website_domain': None,
-}
+# Frozen so the hot-path getters read plain attributes (slot access) and
+# nothing can mutate the configuration behind their caches after startup
+@dataclass(frozen=True, slots=True)
+class _FBConfig:
+    access_token: Optional[str] = None
+    act_id: Optional[str] = None
+    pixel_id: Optional[str] = None
+    page_id: Optional[str] = None
+    instagram_user_id: Optional[str] = None
+    catalog_id: Optional[str] = None
+    website_domain: Optional[str] = None
+
+
+_CFG = _FBConfig()
 
 
 def init_config_from_args():
@@ -51,83 +123,331 @@ def init_config_from_args():
         --catalog-id: Product Catalog ID (optional)
         --website-domain: Website domain for conversions (optional)
     """
-    global _CONFIG
-
-    def get_arg(flag: str, required: bool = False) -> Optional[str]:
-        """Get command-line argument value."""
-        if flag in sys.argv:
-            idx = sys.argv.index(flag) + 1
-            if idx < len(sys.argv):
-                return sys.argv[idx]
-            elif required:
-                raise ValueError(f"{flag} provided but no value followed")
-        elif required:
-            raise ValueError(f"{flag} is required")
-        return None
-
-    _CONFIG['access_token'] = get_arg('--fb-token', required=True)
-    _CONFIG['act_id'] = get_arg('--facebook-ads-ad-account-id')
-    _CONFIG['pixel_id'] = get_arg('--pixel-id')
-    _CONFIG['page_id'] = get_arg('--page-id')
-    _CONFIG['instagram_user_id'] = get_arg('--instagram-user-id')
-    _CONFIG['catalog_id'] = get_arg('--catalog-id')
-    _CONFIG['website_domain'] = get_arg('--website-domain')
+    global _CFG
+
+    # One argparse pass over argv instead of a linear sys.argv scan per flag
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--fb-token')
+    parser.add_argument('--facebook-ads-ad-account-id')
+    parser.add_argument('--pixel-id')
+    parser.add_argument('--page-id')
+    parser.add_argument('--instagram-user-id')
+    parser.add_argument('--catalog-id')
+    parser.add_argument('--website-domain')
+    args, _ = parser.parse_known_args()
+
+    if not args.fb_token:
+        raise ValueError("--fb-token is required")
+
+    _CFG = _FBConfig(
+        access_token=args.fb_token,
+        act_id=args.facebook_ads_ad_account_id,
+        pixel_id=args.pixel_id,
+        page_id=args.page_id,
+        instagram_user_id=args.instagram_user_id,
+        catalog_id=args.catalog_id,
+        website_domain=args.website_domain,
+    )
+
+    # Drop any values cached from a previous initialization
+    get_access_token.cache_clear()
+    get_act_id.cache_clear()
+    get_pixel_id.cache_clear()
+    get_page_id.cache_clear()
+    get_instagram_user_id.cache_clear()
+    get_catalog_id.cache_clear()
+    get_website_domain.cache_clear()
 
     logger.info(f"✓ Facebook API configured (v{FB_API_VERSION})")
-    if _CONFIG['act_id']:
-        logger.info(f"✓ Ad Account ID: {_CONFIG['act_id']}")
-    if _CONFIG['pixel_id']:
-        logger.info(f"✓ Pixel ID: {_CONFIG['pixel_id']}")
-    if _CONFIG['page_id']:
-        logger.info(f"✓ Page ID: {_CONFIG['page_id']}")
+    if _CFG.act_id:
+        logger.info(f"✓ Ad Account ID: {_CFG.act_id}")
+    if _CFG.pixel_id:
+        logger.info(f"✓ Pixel ID: {_CFG.pixel_id}")
+    if _CFG.page_id:
+        logger.info(f"✓ Page ID: {_CFG.page_id}")
 
 
+@lru_cache(maxsize=1)
 def get_access_token() -> str:
-    """Get the configured Facebook access token."""
-    if not _CONFIG['access_token']:
+    """Get the configured Facebook access token.
+
+    Cached after the first successful lookup — the token never changes for
+    the lifetime of the process, so hot request paths skip the dict lookup
+    and validation. init_config_from_args() clears the cache on (re)init.
+    """
+    if not _CFG.access_token:
         raise ValueError("Access token not initialized. Call init_config_from_args() first.")
-    return _CONFIG['access_token']
+    return _CFG.access_token
 
 
+@lru_cache(maxsize=1)
 def get_act_id() -> Optional[str]:
-    """Get the configured Facebook Ad Account ID."""
-    return _CONFIG['act_id']
+    """Get the configured Facebook Ad Account ID (cached; fixed after startup)."""
+    return _CFG.act_id
 
 
+@lru_cache(maxsize=1)
 def get_pixel_id() -> Optional[str]:
-    """Get the configured Meta Pixel ID."""
-    return _CONFIG['pixel_id']
+    """Get the configured Meta Pixel ID (cached; fixed after startup)."""
+    return _CFG.pixel_id
 
 
+@lru_cache(maxsize=1)
 def get_page_id() -> Optional[str]:
-    """Get the configured Facebook Page ID."""
-    return _CONFIG['page_id']
+    """Get the configured Facebook Page ID (cached; fixed after startup)."""
+    return _CFG.page_id
 
 
+@lru_cache(maxsize=1)
 def get_instagram_user_id() -> Optional[str]:
-    """Get the configured Instagram User ID."""
-    return _CONFIG['instagram_user_id']
+    """Get the configured Instagram User ID (cached; fixed after startup)."""
+    return _CFG.instagram_user_id
 
 
+@lru_cache(maxsize=1)
 def get_catalog_id() -> Optional[str]:
-    """Get the configured Product Catalog ID."""
-    return _CONFIG['catalog_id']
+    """Get the configured Product Catalog ID (cached; fixed after startup)."""
+    return _CFG.catalog_id
 
 
+@lru_cache(maxsize=1)
 def get_website_domain() -> Optional[str]:
-    """Get the configured website domain."""
-    return _CONFIG['website_domain']
+    """Get the configured website domain (cached; fixed after startup)."""
+    return _CFG.website_domain
 
 
 # --- HTTP Helpers ---
 
+# Substrings that mark a parameter as sensitive in error output
+_SENSITIVE_KEY_PARTS = ('token', 'secret', 'key')
+
+
+def _redact_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of params safe for logging/error payloads.
+
+    Values whose keys look sensitive (token/secret/key) are replaced with
+    "[REDACTED]". Only built on error paths, so the hot path pays nothing.
+    """
+    return {
+        k: "[REDACTED]" if any(s in k.lower() for s in _SENSITIVE_KEY_PARTS) else v
+        for k, v in params.items()
+    }
+
+# Shared AsyncClient so TCP+TLS handshakes to graph.facebook.com are paid
+# once and connections are reused (with HTTP/2 multiplexing when the 'h2'
+# package is installed) instead of once per tool call.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _accept_encoding() -> str:
+    """Build the Accept-Encoding value for the shared client.
+
+    Graph API list responses are highly compressible JSON (repeated field
+    names, long numeric IDs), so always ask for gzip. Advertise brotli only
+    when a decoder is actually importable — httpx cannot decompress 'br'
+    without one.
+    """
+    try:
+        import brotli  # noqa: F401
+        return "gzip, br"
+    except ImportError:
+        return "gzip"
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled AsyncClient, creating it lazily.
+
+    The client carries FB_GRAPH_URL as base_url, so call sites may pass
+    either bare relative paths ("<node_id>/campaigns") or full URLs;
+    httpx resolves absolute URLs as-is.
+
+    The token deliberately stays a per-call 'access_token' param rather
+    than a client-wide Authorization: Bearer header: Graph rejects
+    requests that carry both forms, paging 'next' URLs come back with
+    the query token baked in, and the batch endpoint wants the form
+    param — so a header default would conflict with every one of those
+    paths. Token hygiene is handled by _redact_params for logs and by
+    the cache keys, which exclude it.
+    """
+    global _http_client
+    if _http_client is None:
+        limits = httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        )
+        try:
+            # retries=1 covers transport-level connect failures only;
+            # request-level retrying stays in the helpers above
+            transport = httpx.AsyncHTTPTransport(retries=1, http2=True, limits=limits)
+        except ImportError:
+            # http2 requires the optional 'h2' package; fall back to HTTP/1.1
+            transport = httpx.AsyncHTTPTransport(retries=1, limits=limits)
+        _http_client = httpx.AsyncClient(
+            base_url=FB_GRAPH_URL,
+            transport=transport,
+            timeout=httpx.Timeout(60.0, connect=10.0),
+            headers={"Accept-Encoding": _accept_encoding()},
+        )
+    return _http_client
+
+
+_http_version_logged = False
+
+
+def _log_http_version(response: httpx.Response) -> None:
+    """Debug-log the negotiated HTTP version once per process.
+
+    Makes it easy to confirm HTTP/2 multiplexing is actually active
+    (i.e. the optional 'h2' package was importable) in deployments.
+    """
+    global _http_version_logged
+    if not _http_version_logged:
+        _http_version_logged = True
+        logger.debug(f"Graph API connection negotiated {response.http_version}")
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient (called on server shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _close_http_client_at_exit() -> None:
+    """Best-effort close of the pooled client at interpreter exit.
+
+    The server's shutdown hook normally closes the client; this covers
+    abnormal exit paths where that hook never runs.
+    """
+    if _http_client is not None:
+        try:
+            asyncio.run(close_http_client())
+        except RuntimeError:
+            # No usable event loop this late; the OS reclaims the sockets
+            pass
+
+
+atexit.register(_close_http_client_at_exit)
+
+
+# Transient failures worth retrying: rate limiting and upstream 5xx.
+# Exponential backoff with jitter so concurrent tool calls don't
+# re-hammer the API in lockstep.
+_RETRY_ATTEMPTS = 4
+_RETRY_BASE_DELAY = 0.25
+_RETRY_MAX_DELAY = 4.0
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_delay(attempt: int) -> float:
+    """Backoff delay (seconds) before retry number `attempt` (0-based)."""
+    delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * (0.5 + random.random() / 2)
+
+
+# --- Adaptive rate-budget pacing ---
+# Graph reports budget consumption through the X-Business-Use-Case-Usage /
+# X-App-Usage response headers (percentages; at 100 every call serializes
+# behind 613 throttle errors). Outgoing calls are gated on a concurrency
+# ceiling derived from the most recent reading so fan-out features back
+# off before the budget empties instead of after.
+_USAGE_PCT = 0.0
+_ACTIVE_CALLS = 0
+_USAGE_POLL_INTERVAL = 0.05  # seconds between gate re-checks
+
+
+def _update_usage_from_headers(headers: Any) -> None:
+    """Record the latest Graph usage percentage from response headers."""
+    raw = headers.get('x-business-use-case-usage') or headers.get('x-app-usage')
+    if not raw:
+        return
+    try:
+        body = _loads(raw)
+    except Exception:
+        return
+    entries = []
+    if isinstance(body, dict):
+        if 'call_count' in body:
+            entries.append(body)
+        else:
+            # Business usage nests per-account lists of metric dicts
+            for value in body.values():
+                if isinstance(value, list):
+                    entries.extend(e for e in value if isinstance(e, dict))
+    readings = [
+        float(e[k])
+        for e in entries
+        for k in ('call_count', 'total_cputime', 'total_time')
+        if isinstance(e.get(k), (int, float))
+    ]
+    if readings:
+        global _USAGE_PCT
+        _USAGE_PCT = max(readings)
+
+
+def _target_concurrency() -> int:
+    """Allowed in-flight Graph calls for the current usage reading.
+
+    A full budget allows 40 concurrent calls; the ceiling steps down as
+    the budget drains and bottoms out at 1 so progress never stops.
+    """
+    return max(1, int((100.0 - min(_USAGE_PCT, 100.0)) / 10) * 4)
+
+
+async def _usage_gate() -> None:
+    """Wait until the in-flight call count drops below the adaptive ceiling.
+
+    A plain counter plus polling instead of asyncio.Semaphore because the
+    ceiling moves with every usage reading and semaphores can't resize.
+    """
+    global _ACTIVE_CALLS
+    while _ACTIVE_CALLS >= _target_concurrency():
+        await asyncio.sleep(_USAGE_POLL_INTERVAL)
+    _ACTIVE_CALLS += 1
+
+
+def _usage_release() -> None:
+    global _ACTIVE_CALLS
+    _ACTIVE_CALLS = max(0, _ACTIVE_CALLS - 1)
+
+
+def _encode_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-encode any dict/list values right before the request goes out.
+
+    Lets tools pass nested structures (targeting, filtering, time_range,
+    promoted_object, ...) as-is and pay a single serialization pass at the
+    HTTP boundary instead of pre-encoding at every call site. Booleans are
+    lowered to the 'true'/'false' strings the Graph API expects.
+    """
+    return {k: _encode_value(v) for k, v in params.items()}
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (dict, list)):
+        return _dump(value, pretty=False)
+    return value
+
+
 async def _make_graph_api_call(url: str, params: Dict[str, Any]) -> Dict:
     """
     Make an async GET request to the Facebook Graph API.
 
+    Transient failures (429/5xx responses, timeouts) are retried with
+    jittered exponential backoff before the error is surfaced.
+
+    There is deliberately no raw-text variant of this helper: tools
+    return parsed dicts (the MCP layer serializes once at the wire), so
+    a response.text pass-through would have no consumer, and throttle
+    detection in the paginators needs the parsed error body anyway.
+
     Args:
         url: The API endpoint URL
-        params: Query parameters (including access_token)
+        params: Query parameters (including access_token); dict/list values
+            are JSON-encoded automatically
 
     Returns:
         Dict: JSON response from the API
@@ -135,75 +455,317 @@ async def _make_graph_api_call(url: str, params: Dict[str, Any]) -> Dict:
     Raises:
         httpx.HTTPStatusError: For 4xx/5xx responses
     """
+    client = _get_http_client()
+    # Encode the query string once up front (it also survives retries)
+    # instead of having the client re-encode the params — including the
+    # large access token — on every send
+    full_url = f"{url}?{urlencode(_encode_params(params))}"
+    await _usage_gate()
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        # Log error with redacted sensitive params
-        safe_params = {
-            k: "[REDACTED]" if any(s in k.lower() for s in ['token', 'secret', 'key']) else v
-            for k, v in params.items()
-        }
-        logger.error(f"❌ Graph API GET error: {url} | Params: {safe_params} | Error: {e}")
-        raise
-    except httpx.RequestError as e:
-        logger.error(f"❌ Request error: {url} | Error: {e}")
-        raise
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                response = await client.get(full_url)
+                _log_http_version(response)
+                _update_usage_from_headers(response.headers)
+                if response.status_code in _RETRYABLE_STATUS and attempt < _RETRY_ATTEMPTS - 1:
+                    logger.warning(
+                        f"Graph API GET got {response.status_code}, retrying: {url}"
+                    )
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                response.raise_for_status()
+                # Decode the raw bytes with the orjson-backed parser rather
+                # than response.json(); large bodies parse off-loop
+                return await _loads_async(response.content)
+            except httpx.TimeoutException as e:
+                if attempt < _RETRY_ATTEMPTS - 1:
+                    logger.warning(f"Graph API GET timed out, retrying: {url}")
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                logger.error(f"❌ Request error: {url} | Error: {e}")
+                raise
+            except httpx.HTTPStatusError as e:
+                # Log error with redacted sensitive params
+                safe_params = _redact_params(params)
+                logger.error(f"❌ Graph API GET error: {url} | Params: {safe_params} | Error: {e}")
+                raise
+            except httpx.RequestError as e:
+                logger.error(f"❌ Request error: {url} | Error: {e}")
+                raise
+    finally:
+        _usage_release()
+
+
+async def _make_graph_api_call_stream(url: str, params: Dict[str, Any]) -> Dict:
+    """GET a large response without double-buffering the body.
+
+    Streams the body chunk by chunk and decodes once at the end, so peak
+    memory stays near one copy of the payload instead of httpx's internal
+    buffer plus a second full bytes object. Intended for bulk list walks
+    where pages run to hundreds of KB; single-node reads should keep
+    using _make_graph_api_call. A fully incremental parser (ijson) was
+    considered and passed on to keep the dependency set unchanged.
+
+    Rides the same usage gate and retry/backoff path as the
+    non-streaming call, so a transient 503 on page 40 of a long walk
+    retries in place instead of discarding every page already fetched.
+    """
+    client = _get_http_client()
+    full_url = f"{url}?{urlencode(_encode_params(params))}"
+    await _usage_gate()
+    try:
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                async with client.stream("GET", full_url) as response:
+                    _log_http_version(response)
+                    _update_usage_from_headers(response.headers)
+                    if (response.status_code in _RETRYABLE_STATUS
+                            and attempt < _RETRY_ATTEMPTS - 1):
+                        logger.warning(
+                            f"Graph API GET got {response.status_code}, retrying: {url}"
+                        )
+                    else:
+                        if response.is_error:
+                            # Streamed bodies are unread when raise_for_status
+                            # fires; buffer first so the exception carries the
+                            # Graph error payload (throttle detection reads it)
+                            await response.aread()
+                        response.raise_for_status()
+                        chunks = []
+                        async for chunk in response.aiter_bytes():
+                            chunks.append(chunk)
+                        return await _loads_async(b"".join(chunks))
+                await asyncio.sleep(_retry_delay(attempt))
+            except httpx.TimeoutException as e:
+                if attempt < _RETRY_ATTEMPTS - 1:
+                    logger.warning(f"Graph API GET timed out, retrying: {url}")
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                logger.error(f"❌ Request error: {url} | Error: {e}")
+                raise
+            except httpx.HTTPStatusError as e:
+                safe_params = _redact_params(params)
+                logger.error(f"❌ Graph API GET error: {url} | Params: {safe_params} | Error: {e}")
+                raise
+            except httpx.RequestError as e:
+                logger.error(f"❌ Request error: {url} | Error: {e}")
+                raise
+    finally:
+        _usage_release()
 
 
 async def _make_graph_api_post(url: str, data: Dict[str, Any]) -> Dict:
     """
     Make an async POST request to the Facebook Graph API.
 
+    Transient failures (429/5xx responses, timeouts) are retried with
+    jittered exponential backoff before the error is surfaced.
+
     Args:
         url: The API endpoint URL
-        data: POST data (including access_token)
+        data: POST data (including access_token); dict/list values are
+            JSON-encoded automatically
 
     Returns:
         Dict: JSON response from the API, or error dict if API returned an error
     """
+    client = _get_http_client()
+    encoded = _encode_params(data)
+    await _usage_gate()
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(url, data=data)
-
-        response_json = response.json()
-
-        # Facebook API sometimes returns errors with 200 status
-        if 'error' in response_json:
-            safe_data = {k: v for k, v in data.items() if 'token' not in k.lower()}
-            return {
-                "error": response_json['error'],
-                "payload_sent": safe_data,
-                "url": url,
-                "status_code": response.status_code
-            }
-
-        response.raise_for_status()
-        return response_json
-
-    except httpx.HTTPStatusError as e:
-        error_details = {
-            "error": "HTTP error",
-            "details": str(e),
-            "url": url,
-            "status_code": e.response.status_code if hasattr(e, 'response') else None
-        }
-        if hasattr(e, 'response') and e.response is not None:
+        for attempt in range(_RETRY_ATTEMPTS):
             try:
-                api_error = e.response.json()
-                if 'error' in api_error:
-                    error_details["api_error"] = api_error['error']
-            except:
-                error_details["response_text"] = e.response.text[:500]
-        return error_details
-    except httpx.RequestError as e:
-        return {
-            "error": "Request failed",
-            "details": str(e),
-            "url": url
+                response = await client.post(url, data=encoded)
+                _log_http_version(response)
+                _update_usage_from_headers(response.headers)
+                if response.status_code in _RETRYABLE_STATUS and attempt < _RETRY_ATTEMPTS - 1:
+                    logger.warning(
+                        f"Graph API POST got {response.status_code}, retrying: {url}"
+                    )
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+
+                # Same fast path as the GET helper: parse bytes with the
+                # orjson-backed parser instead of response.json()
+                response_json = await _loads_async(response.content)
+
+                # Facebook API sometimes returns errors with 200 status
+                if 'error' in response_json:
+                    safe_data = _redact_params(data)
+                    return {
+                        "error": response_json['error'],
+                        "payload_sent": safe_data,
+                        "url": url,
+                        "status_code": response.status_code
+                    }
+
+                response.raise_for_status()
+                return response_json
+
+            except httpx.TimeoutException as e:
+                if attempt < _RETRY_ATTEMPTS - 1:
+                    logger.warning(f"Graph API POST timed out, retrying: {url}")
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                return {
+                    "error": "Request failed",
+                    "details": str(e),
+                    "url": url
+                }
+            except httpx.HTTPStatusError as e:
+                error_details = {
+                    "error": "HTTP error",
+                    "details": str(e),
+                    "url": url,
+                    "status_code": e.response.status_code if hasattr(e, 'response') else None
+                }
+                if hasattr(e, 'response') and e.response is not None:
+                    try:
+                        api_error = _loads(e.response.content)
+                        if 'error' in api_error:
+                            error_details["api_error"] = api_error['error']
+                    except:
+                        error_details["response_text"] = e.response.text[:500]
+                return error_details
+            except httpx.RequestError as e:
+                return {
+                    "error": "Request failed",
+                    "details": str(e),
+                    "url": url
+                }
+    finally:
+        _usage_release()
+
+
+async def _make_graph_api_batch(subrequests: List[Dict[str, Any]]) -> List[Optional[Dict]]:
+    """
+    Execute multiple Graph API sub-requests in as few HTTP round-trips as possible.
+
+    Uses the Graph API batch endpoint (POST / with a JSON-encoded 'batch'
+    param). Sub-requests are dicts like:
+        {"method": "POST", "relative_url": "<node_id>", "body": "status=PAUSED"}
+
+    Chunks of up to GRAPH_BATCH_LIMIT sub-requests are sent concurrently.
+
+    Args:
+        subrequests: List of Graph batch sub-request dicts
+
+    Returns:
+        List[Optional[Dict]]: Decoded sub-response bodies aligned with
+        subrequests. Entries are None when the API returned no body for a
+        sub-request, or an error dict when the enclosing batch call failed.
+    """
+    access_token = get_access_token()
+    chunks = [
+        subrequests[i:i + GRAPH_BATCH_LIMIT]
+        for i in range(0, len(subrequests), GRAPH_BATCH_LIMIT)
+    ]
+
+    async def _post_chunk(chunk: List[Dict[str, Any]]):
+        data = {
+            "access_token": access_token,
+            "batch": _dump(chunk, pretty=False)
         }
+        return await _make_graph_api_post(f"{FB_GRAPH_URL}/", data)
+
+    responses = await asyncio.gather(*(_post_chunk(chunk) for chunk in chunks))
+
+    results: List[Optional[Dict]] = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, dict):
+            # Transport-level failure for the whole chunk; mirror the error
+            # for every sub-request so results stay aligned with inputs.
+            results.extend([response] * len(chunk))
+            continue
+        for entry in response:
+            if entry and entry.get("body"):
+                results.append(await _loads_async(entry["body"]))
+            else:
+                results.append(None)
+
+    return results
+
+
+# --- Read-through TTL cache ---
+# Small in-process cache for Graph API reads whose results are effectively
+# immutable over short windows (product sets, creatives). Keyed on the URL
+# and sorted params minus the access token. Kept dependency-free: a dict of
+# key -> (expiry monotonic time, payload) with opportunistic pruning.
+_READ_CACHE: Dict[Any, Any] = {}
+_READ_CACHE_MAX = 2048
+_READ_CACHE_TTL = 60.0  # seconds
+
+
+def _read_cache_key(url: str, params: Dict[str, Any]):
+    """Build a hashable cache key from a URL and its query params."""
+    return (url, tuple(sorted(
+        (k, v) for k, v in params.items() if k != 'access_token'
+    )))
+
+
+def clear_read_cache() -> None:
+    """Drop all cached Graph API read responses."""
+    _READ_CACHE.clear()
+
+
+def _invalidate_read_cache(node_id: str) -> None:
+    """Drop cached reads that reference the given node id.
+
+    Called after successful writes so subsequent reads of the updated
+    object (by-id fetches, ids= multi-reads) go back to the API.
+    """
+    stale = [
+        key for key in _READ_CACHE
+        if node_id in key[0] or any(node_id in str(v) for _, v in key[1])
+    ]
+    for key in stale:
+        _READ_CACHE.pop(key, None)
+
+
+async def _cached_graph_get(url: str, params: Dict[str, Any],
+                            ttl: float = _READ_CACHE_TTL) -> Dict:
+    """GET via _make_graph_api_call with a short-lived in-process cache.
+
+    Repeat reads within the TTL window skip the network entirely. Only use
+    this for endpoints where slightly stale data is acceptable.
+    """
+    key = _read_cache_key(url, params)
+    cached = _READ_CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    data = await _make_graph_api_call(url, params)
+
+    if len(_READ_CACHE) >= _READ_CACHE_MAX:
+        # Drop expired entries first; if nothing expired, start fresh
+        live = {k: v for k, v in _READ_CACHE.items() if v[0] > now}
+        _READ_CACHE.clear()
+        if len(live) < _READ_CACHE_MAX:
+            _READ_CACHE.update(live)
+    _READ_CACHE[key] = (now + ttl, data)
+    return data
+
+
+# Parameter classification for _prepare_params, hoisted to module scope so
+# each dispatch is an O(1) frozenset lookup instead of rebuilding and
+# scanning list literals on every tool call
+_JSON_KEYS = frozenset({
+    'filtering', 'time_range', 'time_ranges', 'effective_status',
+    'special_ad_categories', 'objective', 'ab_test_control_setups',
+    'buyer_guarantee_agreement_status', 'targeting', 'frequency_control_specs',
+    'promoted_object',
+})
+# These must reach Graph as one comma-joined value ("fields=a,b,c");
+# urlencode(doseq=True) / httpx list params would emit repeated keys
+# ("fields=a&fields=b"), which Graph treats as only the last one.
+_CSV_KEYS = frozenset({
+    'fields', 'action_attribution_windows', 'action_breakdowns', 'breakdowns',
+})
+_NUM_STR_KEYS = frozenset({
+    'daily_budget', 'lifetime_budget', 'bid_cap', 'spend_cap', 'bid_amount',
+    'roas_average_floor',
+})
 
 
 def _prepare_params(base_params: Dict[str, Any], **kwargs) -> Dict[str, Any]:
@@ -211,27 +773,26 @@ def _prepare_params(base_params: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     Prepare API parameters by adding optional kwargs and handling special encoding.
 
     Args:
-        base_params: Base parameters dict
+        base_params: Base parameters dict. Populated in place and returned;
+            every call site builds it as a fresh literal, so copying it
+            here would only add an allocation per call.
         **kwargs: Additional optional parameters
 
     Returns:
         Dict: Combined parameters with proper encoding
     """
-    params = base_params.copy()
+    params = base_params
 
     for key, value in kwargs.items():
         if value is None:
             continue
 
         # JSON encoding for complex structures
-        if key in ['filtering', 'time_range', 'time_ranges', 'effective_status',
-                   'special_ad_categories', 'objective', 'ab_test_control_setups',
-                   'buyer_guarantee_agreement_status', 'targeting', 'frequency_control_specs',
-                   'promoted_object'] and isinstance(value, (list, dict)):
-            params[key] = json.dumps(value)
+        if key in _JSON_KEYS and isinstance(value, (list, dict)):
+            params[key] = _dump(value, pretty=False)
 
         # List to comma-separated string
-        elif key in ['fields', 'action_attribution_windows', 'action_breakdowns', 'breakdowns'] and isinstance(value, list):
+        elif key in _CSV_KEYS and isinstance(value, list):
             params[key] = ','.join(str(v) for v in value)
 
         # Boolean to string
@@ -239,7 +800,7 @@ def _prepare_params(base_params: Dict[str, Any], **kwargs) -> Dict[str, Any]:
             params[key] = "true" if value else "false"
 
         # Numbers to strings for budget/bid fields
-        elif key in ['daily_budget', 'lifetime_budget', 'bid_cap', 'spend_cap', 'bid_amount', 'roas_average_floor']:
+        elif key in _NUM_STR_KEYS:
             params[key] = str(value)
 
         else:
@@ -248,74 +809,57 @@ def _prepare_params(base_params: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     return params
 
 
-def _build_insights_params(
-    base_params: Dict[str, Any],
-    fields: Optional[List[str]] = None,
-    date_preset: Optional[str] = None,
-    time_range: Optional[Dict[str, str]] = None,
-    time_ranges: Optional[List[Dict[str, str]]] = None,
-    time_increment: Optional[str] = None,
-    level: Optional[str] = None,
-    action_attribution_windows: Optional[List[str]] = None,
-    action_breakdowns: Optional[List[str]] = None,
-    action_report_time: Optional[str] = None,
-    breakdowns: Optional[List[str]] = None,
-    default_summary: bool = False,
-    use_account_attribution_setting: bool = False,
-    use_unified_attribution_setting: bool = True,
-    filtering: Optional[List[dict]] = None,
-    sort: Optional[str] = None,
-    limit: Optional[int] = None,
-    after: Optional[str] = None,
-    before: Optional[str] = None,
-    offset: Optional[int] = None,
-    since: Optional[str] = None,
-    until: Optional[str] = None,
-    locale: Optional[str] = None
-) -> Dict[str, Any]:
-    """
-    Build parameter dictionary specifically for insights API calls.
-
-    Handles all the complex parameter combinations and encodings
-    required by the Insights API.
+# 512 entries comfortably covers dashboards polling many distinct
+# (fields, level, breakdowns) combos without re-running the CSV joins
+@lru_cache(maxsize=512)
+def _insights_static_params(
+    fields: Optional[Tuple[str, ...]],
+    level: Optional[str],
+    action_attribution_windows: Optional[Tuple[str, ...]],
+    action_breakdowns: Optional[Tuple[str, ...]],
+    action_report_time: Optional[str],
+    breakdowns: Optional[Tuple[str, ...]],
+    sort: Optional[str],
+    locale: Optional[str],
+    date_preset: Optional[str],
+    time_increment: Optional[str],
+    default_summary: bool,
+    use_account_attribution_setting: bool,
+    use_unified_attribution_setting: bool,
+) -> Tuple[Tuple[str, str], ...]:
+    """Build the shape-stable slice of an insights query, memoized.
+
+    Callers tend to reuse the same (fields, level, breakdowns, ...) combo
+    across many entities, so the CSV joins and flag handling are paid once
+    per distinct combination. Returns a tuple of (key, value) pairs; the
+    outer builder merges it into a fresh dict per call. This is the
+    per-shape specialization point — runtime codegen (exec'ing a closure
+    per kwarg shape) would only shave the residual dict merge while
+    making the hot path unreadable and undebuggable.
     """
-    # Start with base params and add common fields
-    params = _prepare_params(
-        base_params,
-        fields=fields,
-        level=level,
-        action_attribution_windows=action_attribution_windows,
-        action_breakdowns=action_breakdowns,
-        action_report_time=action_report_time,
-        breakdowns=breakdowns,
-        filtering=filtering,
-        sort=sort,
-        limit=limit,
-        after=after,
-        before=before,
-        offset=offset,
-        locale=locale
-    )
-
-    # Handle time parameters (specific logic for insights)
-    time_params_provided = time_range or time_ranges or since or until
-    if not time_params_provided and date_preset:
+    params: Dict[str, Any] = {}
+
+    if fields:
+        params['fields'] = ','.join(str(f) for f in fields)
+    if level:
+        params['level'] = level
+    if action_attribution_windows:
+        params['action_attribution_windows'] = ','.join(str(w) for w in action_attribution_windows)
+    if action_breakdowns:
+        params['action_breakdowns'] = ','.join(str(b) for b in action_breakdowns)
+    if action_report_time:
+        params['action_report_time'] = action_report_time
+    if breakdowns:
+        params['breakdowns'] = ','.join(str(b) for b in breakdowns)
+    if sort:
+        params['sort'] = sort
+    if locale:
+        params['locale'] = locale
+    if date_preset:
         params['date_preset'] = date_preset
-
-    if time_range:
-        params['time_range'] = json.dumps(time_range)
-    if time_ranges:
-        params['time_ranges'] = json.dumps(time_ranges)
-    if time_increment and time_increment != 'all_days':  # API default
+    if time_increment:
         params['time_increment'] = time_increment
 
-    # Time-based pagination (only if specific time range isn't set)
-    if not time_range and not time_ranges:
-        if since:
-            params['since'] = since
-        if until:
-            params['until'] = until
-
     # Boolean flags need specific handling ('true'/'false' strings)
     if default_summary:
         params['default_summary'] = 'true'
@@ -324,4 +868,106 @@ def _build_insights_params(
     if use_unified_attribution_setting:
         params['use_unified_attribution_setting'] = 'true'
 
+    return tuple(params.items())
+
+
+@dataclass(frozen=True, slots=True)
+class InsightsQuery:
+    """Immutable bundle of every insights query option.
+
+    Built once per call and passed by reference, replacing the former
+    convention of threading twenty-odd keyword arguments through each
+    layer. Field names and defaults match the public get_*_insights
+    signatures.
+    """
+    fields: Optional[List[str]] = None
+    date_preset: Optional[str] = None
+    time_range: Optional[Dict[str, str]] = None
+    time_ranges: Optional[List[Dict[str, str]]] = None
+    time_increment: Optional[str] = None
+    level: Optional[str] = None
+    action_attribution_windows: Optional[List[str]] = None
+    action_breakdowns: Optional[List[str]] = None
+    action_report_time: Optional[str] = None
+    breakdowns: Optional[List[str]] = None
+    default_summary: bool = False
+    use_account_attribution_setting: bool = False
+    use_unified_attribution_setting: bool = True
+    filtering: Optional[List[dict]] = None
+    sort: Optional[str] = None
+    limit: Optional[int] = None
+    after: Optional[str] = None
+    before: Optional[str] = None
+    offset: Optional[int] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+    locale: Optional[str] = None
+
+
+def _insights_query_params(base_params: Dict[str, Any], q: InsightsQuery) -> Dict[str, Any]:
+    """
+    Build the parameter dictionary for an insights call from an InsightsQuery.
+
+    Handles all the complex parameter combinations and encodings
+    required by the Insights API. The shape-stable slice (fields, level,
+    breakdowns, flags, ...) is served from _insights_static_params;
+    volatile values (cursors, time structures) are merged per call.
+    """
+    time_params_provided = q.time_range or q.time_ranges or q.since or q.until
+
+    static = _insights_static_params(
+        tuple(q.fields) if q.fields is not None else None,
+        q.level,
+        tuple(q.action_attribution_windows) if q.action_attribution_windows is not None else None,
+        tuple(q.action_breakdowns) if q.action_breakdowns is not None else None,
+        q.action_report_time,
+        tuple(q.breakdowns) if q.breakdowns is not None else None,
+        q.sort,
+        q.locale,
+        # date_preset only applies when no explicit time params are given
+        q.date_preset if (q.date_preset and not time_params_provided) else None,
+        # 'all_days' is the API default and is omitted
+        q.time_increment if (q.time_increment and q.time_increment != 'all_days') else None,
+        q.default_summary,
+        q.use_account_attribution_setting,
+        q.use_unified_attribution_setting,
+    )
+
+    params = dict(base_params)
+    params.update(static)
+
+    # Volatile and unhashable pieces stay per-call
+    if q.filtering:
+        params['filtering'] = _dump(q.filtering, pretty=False)
+    if q.time_range:
+        params['time_range'] = _dump(q.time_range, pretty=False)
+    if q.time_ranges:
+        params['time_ranges'] = _dump(q.time_ranges, pretty=False)
+
+    # Time-based pagination (only if specific time range isn't set)
+    if not q.time_range and not q.time_ranges:
+        if q.since:
+            params['since'] = q.since
+        if q.until:
+            params['until'] = q.until
+
+    if q.limit is not None:
+        params['limit'] = q.limit
+    if q.after:
+        params['after'] = q.after
+    if q.before:
+        params['before'] = q.before
+    if q.offset is not None:
+        params['offset'] = q.offset
+
     return params
+
+
+def _build_insights_params(base_params: Dict[str, Any], **query: Any) -> Dict[str, Any]:
+    """Keyword-argument front door for _insights_query_params.
+
+    Kept for call sites that assemble options dynamically (batch specs,
+    name-based queries); raises TypeError on unknown option names via
+    the InsightsQuery constructor.
+    """
+    return _insights_query_params(base_params, InsightsQuery(**query))
@@ -5,18 +5,81 @@ This module provides tools for creating and managing Facebook/Meta ad campaigns,
 including both Campaign Budget Optimization (CBO) and Ad Set Budget Optimization (ABO) campaigns.
 """
 
-import json
+import asyncio
+from urllib.parse import urlencode
 from typing import List, Optional, Dict, Any
 from .api import (
-    FB_GRAPH_URL,
+    _dump,
     get_access_token,
     get_act_id,
-    _make_graph_api_call,
+    _cached_graph_get,
+    _invalidate_read_cache,
+    _make_graph_api_call_stream,
     _make_graph_api_post,
-    _prepare_params
+    _make_graph_api_batch,
+    _prepare_params,
+    _redact_params
 )
 
 
+# Relative to the pooled client's base_url (FB_GRAPH_URL), so URL
+# construction never re-interpolates the constant graph prefix
+_CAMPAIGNS_URL_TPL = "{}/campaigns"
+
+# Validation sets built once at import so the checks below are O(1)
+# hash lookups; catching a bad objective here saves a full round-trip
+# to Facebook that would fail anyway
+_VALID_STATUSES = frozenset({"ACTIVE", "PAUSED", "ARCHIVED", "DELETED"})
+_VALID_STATUSES_MSG = ', '.join(sorted(_VALID_STATUSES))
+_VALID_OBJECTIVES = frozenset({
+    "OUTCOME_APP_PROMOTION", "OUTCOME_AWARENESS", "OUTCOME_ENGAGEMENT",
+    "OUTCOME_LEADS", "OUTCOME_SALES", "OUTCOME_TRAFFIC",
+})
+_VALID_OBJECTIVES_MSG = ', '.join(sorted(_VALID_OBJECTIVES))
+_CAPPED_BID_STRATEGIES = frozenset({"LOWEST_COST_WITH_BID_CAP", "COST_CAP"})
+
+# Fixed-message error payloads serialized once at import; these sit on
+# validation paths that run before any I/O
+_ERR_NO_ACT_ID = _dump({
+    "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
+})
+_ERR_NO_NAME = _dump({"error": "No campaign name provided"})
+_ERR_NO_OBJECTIVE = _dump({"error": "No campaign objective provided"})
+_ERR_CBO_BUDGET_REQUIRED = _dump({
+    "error": "CBO campaigns require either daily_budget or lifetime_budget"
+})
+_ERR_NO_CAMPAIGN_ID = _dump({"error": "No campaign ID provided"})
+_ERR_NO_BUDGET = _dump({
+    "error": "Either daily_budget or lifetime_budget must be provided"
+})
+_ERR_NO_STATUS = _dump({"error": "No status provided"})
+
+
+def _project_rows(data: Dict, fields: Optional[List[str]]) -> Dict:
+    """Prune list rows down to the requested fields.
+
+    The Graph API mostly honors the fields param, but rows can still
+    carry extra envelope keys the caller never asked for; dropping them
+    before serialization keeps the payload proportional to the request.
+    Builds new structures so cached responses are never mutated.
+    """
+    if not fields or 'data' not in data:
+        return data
+    # 'id' always comes back and is needed for follow-up calls
+    wanted = {'id'}
+    for f in fields:
+        # Nested expansions ('insights{spend}') come back under the bare
+        # field name and '.as(alias)' renames the key to the alias, so
+        # key on those instead of the raw request string
+        if '.as(' in f:
+            wanted.add(f[f.index('.as(') + 4:].rstrip(')'))
+        wanted.add(f.split('{', 1)[0])
+    return {
+        **data,
+        'data': [{k: row[k] for k in row.keys() & wanted} for row in data['data']],
+    }
+
+
 async def create_cbo_campaign(
     name: str,
     objective: str,
@@ -51,30 +114,33 @@ async def create_cbo_campaign(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
-            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
+        return _ERR_NO_ACT_ID
 
     if not name:
-        return json.dumps({"error": "No campaign name provided"}, indent=2)
+        return _ERR_NO_NAME
 
     if not objective:
-        return json.dumps({"error": "No campaign objective provided"}, indent=2)
+        return _ERR_NO_OBJECTIVE
+
+    if objective not in _VALID_OBJECTIVES:
+        return _dump({
+            "error": f"Invalid objective '{objective}'. Must be one of: {_VALID_OBJECTIVES_MSG}"
+        })
 
     # For CBO campaigns, either daily_budget or lifetime_budget is required
     if not daily_budget and not lifetime_budget:
-        return json.dumps({"error": "CBO campaigns require either daily_budget or lifetime_budget"}, indent=2)
+        return _ERR_CBO_BUDGET_REQUIRED
 
     # Default bid strategy for CBO campaigns
     if not bid_strategy:
         bid_strategy = "LOWEST_COST_WITHOUT_CAP"
 
     # Validate bid_amount requirement
-    if bid_strategy in ["LOWEST_COST_WITH_BID_CAP", "COST_CAP"] and not bid_amount:
-        return json.dumps({"error": f"bid_amount is required when bid_strategy is {bid_strategy}"}, indent=2)
+    if bid_strategy in _CAPPED_BID_STRATEGIES and not bid_amount:
+        return _dump({"error": f"bid_amount is required when bid_strategy is {bid_strategy}"})
 
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/campaigns"
+    url = _CAMPAIGNS_URL_TPL.format(act_id)
 
     base_params = {
         "access_token": access_token,
@@ -98,14 +164,16 @@ async def create_cbo_campaign(
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        # A new campaign must show up in cached account-level lists
+        _invalidate_read_cache(url)
+        return _dump(data)
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return _dump({
             "error": "Failed to create CBO campaign",
             "details": error_msg,
-            "params_sent": {k: v for k, v in params.items() if 'token' not in k.lower()}
-        }, indent=2)
+            "params_sent": _redact_params(params)
+        })
 
 
 async def create_abo_campaign(
@@ -136,18 +204,21 @@ async def create_abo_campaign(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
-            "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
+        return _ERR_NO_ACT_ID
 
     if not name:
-        return json.dumps({"error": "No campaign name provided"}, indent=2)
+        return _ERR_NO_NAME
 
     if not objective:
-        return json.dumps({"error": "No campaign objective provided"}, indent=2)
+        return _ERR_NO_OBJECTIVE
+
+    if objective not in _VALID_OBJECTIVES:
+        return _dump({
+            "error": f"Invalid objective '{objective}'. Must be one of: {_VALID_OBJECTIVES_MSG}"
+        })
 
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/campaigns"
+    url = _CAMPAIGNS_URL_TPL.format(act_id)
 
     base_params = {
         "access_token": access_token,
@@ -167,14 +238,16 @@ async def create_abo_campaign(
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2)
+        # A new campaign must show up in cached account-level lists
+        _invalidate_read_cache(url)
+        return _dump(data)
     except Exception as e:
         error_msg = str(e)
-        return json.dumps({
+        return _dump({
             "error": "Failed to create ABO campaign",
             "details": error_msg,
-            "params_sent": {k: v for k, v in params.items() if 'token' not in k.lower()}
-        }, indent=2)
+            "params_sent": _redact_params(params)
+        })
 
 
 async def update_campaign_budget(
@@ -193,13 +266,13 @@ async def update_campaign_budget(
         str: Pretty-printed JSON with update result or error payload.
     """
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return _ERR_NO_CAMPAIGN_ID
 
     if not daily_budget and not lifetime_budget:
-        return json.dumps({"error": "Either daily_budget or lifetime_budget must be provided"}, indent=2)
+        return _ERR_NO_BUDGET
 
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{campaign_id}"
+    url = campaign_id
 
     params = {"access_token": access_token}
     if daily_budget:
@@ -209,13 +282,20 @@ async def update_campaign_budget(
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # The campaign just changed; drop any cached reads that include
+        # it so the next by-id fetch sees the new budget, plus the
+        # account-level list reads whose keys don't carry the campaign id
+        _invalidate_read_cache(campaign_id)
+        act_id = get_act_id()
+        if act_id:
+            _invalidate_read_cache(_CAMPAIGNS_URL_TPL.format(act_id))
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to update campaign budget",
             "details": str(e),
             "campaign_id": campaign_id
-        }, indent=2, ensure_ascii=False)
+        })
 
 
 async def deactivate_or_activate_campaign(
@@ -238,30 +318,37 @@ async def deactivate_or_activate_campaign(
         str: Pretty-printed JSON with update result or error payload.
     """
     if not campaign_id:
-        return json.dumps({"error": "No campaign ID provided"}, indent=2)
+        return _ERR_NO_CAMPAIGN_ID
 
     if not status:
-        return json.dumps({"error": "No status provided"}, indent=2)
+        return _ERR_NO_STATUS
 
-    valid_statuses = ["ACTIVE", "PAUSED", "ARCHIVED", "DELETED"]
-    if status not in valid_statuses:
-        return json.dumps({
-            "error": f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}"
-        }, indent=2)
+    if status not in _VALID_STATUSES:
+        return _dump({
+            "error": f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}"
+        })
 
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{campaign_id}"
+    url = campaign_id
     params = {"access_token": access_token, "status": status}
 
     try:
         data = await _make_graph_api_post(url, params)
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # Status flips are usually followed by a verification read;
+        # invalidate so it reflects the new status, not the cache —
+        # including the account-level list reads whose keys don't carry
+        # the campaign id
+        _invalidate_read_cache(campaign_id)
+        act_id = get_act_id()
+        if act_id:
+            _invalidate_read_cache(_CAMPAIGNS_URL_TPL.format(act_id))
+        return _dump(data)
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "error": "Failed to update campaign status",
             "details": str(e),
             "campaign_id": campaign_id
-        }, indent=2, ensure_ascii=False)
+        })
 
 
 async def get_campaign_by_id(
@@ -302,7 +389,7 @@ async def get_campaign_by_id(
         ```
     """
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{campaign_id}"
+    url = campaign_id
     params = {'access_token': access_token}
 
     if fields:
@@ -311,7 +398,78 @@ async def get_campaign_by_id(
     if date_format:
         params['date_format'] = date_format
 
-    return await _make_graph_api_call(url, params)
+    # Pure read that LLM callers tend to re-issue within seconds; serve
+    # repeats from the TTL cache instead of another round-trip
+    return await _cached_graph_get(url, params)
+
+
+async def get_campaigns_by_ids(
+    campaign_ids: List[str],
+    fields: Optional[List[str]] = None,
+    date_format: Optional[str] = None,
+    max_concurrency: int = 10
+) -> Dict:
+    """Retrieves detailed information about multiple campaigns concurrently.
+
+    Small lists fire one GET per campaign through a bounded semaphore so
+    total wall time approaches the slowest single request. Past a handful
+    of IDs the reads are folded into Graph API batch requests instead,
+    which removes the extra HTTP round-trips entirely.
+
+    Args:
+        campaign_ids (List[str]): Campaign IDs to retrieve information for.
+        fields (Optional[List[str]]): Specific fields to retrieve for each campaign.
+        date_format (Optional[str]): Format for date responses ('U', 'Y-m-d H:i:s', or None).
+        max_concurrency (int): Maximum number of in-flight requests (default: 10).
+
+    Returns:
+        Dict: Dictionary keyed by campaign ID; failed lookups map to an
+        error payload instead of aborting the whole batch.
+
+    Example:
+        ```python
+        campaigns = await get_campaigns_by_ids(
+            campaign_ids=["23843211234567", "23843211234568"],
+            fields=["name", "objective", "effective_status"]
+        )
+        ```
+    """
+    if len(campaign_ids) > 3:
+        query = {}
+        if fields:
+            query['fields'] = ','.join(fields)
+        if date_format:
+            query['date_format'] = date_format
+        suffix = f"?{urlencode(query)}" if query else ""
+
+        responses = await _make_graph_api_batch([
+            {"method": "GET", "relative_url": f"{campaign_id}{suffix}"}
+            for campaign_id in campaign_ids
+        ])
+        return {
+            campaign_id: (
+                response if response is not None
+                else {"error": "No response returned for this sub-request"}
+            )
+            for campaign_id, response in zip(campaign_ids, responses)
+        }
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(campaign_id: str) -> Dict:
+        async with semaphore:
+            return await get_campaign_by_id(campaign_id, fields, date_format)
+
+    responses = await asyncio.gather(
+        *(fetch(campaign_id) for campaign_id in campaign_ids),
+        return_exceptions=True
+    )
+    return {
+        campaign_id: (
+            {"error": str(response)} if isinstance(response, Exception) else response
+        )
+        for campaign_id, response in zip(campaign_ids, responses)
+    }
 
 
 async def get_campaigns_by_adaccount(
@@ -373,52 +531,113 @@ async def get_campaigns_by_adaccount(
         )
 
     access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/campaigns"
-    params = {'access_token': access_token}
-
-    if fields:
-        params['fields'] = ','.join(fields)
-
-    if filtering:
-        params['filtering'] = json.dumps(filtering)
+    url = _CAMPAIGNS_URL_TPL.format(act_id)
 
-    if limit is not None:
-        params['limit'] = limit
-
-    if after:
-        params['after'] = after
-
-    if before:
-        params['before'] = before
-
-    if date_preset:
-        params['date_preset'] = date_preset
-
-    if time_range:
-        params['time_range'] = json.dumps(time_range)
+    # One _prepare_params pass replaces the former per-field json.dumps
+    # chain, so each structure is serialized exactly once
+    params = _prepare_params(
+        {'access_token': access_token},
+        fields=fields,
+        filtering=filtering,
+        limit=limit,
+        after=after,
+        before=before,
+        date_preset=date_preset,
+        time_range=time_range,
+        updated_since=updated_since,
+        effective_status=effective_status,
+        is_completed=is_completed,
+        special_ad_categories=special_ad_categories,
+        objective=objective,
+        buyer_guarantee_agreement_status=buyer_guarantee_agreement_status,
+        date_format=date_format,
+        include_drafts=include_drafts
+    )
 
-    if updated_since:
-        params['updated_since'] = updated_since
+    # List reads share the same TTL cache; repeated identical queries
+    # (retries, follow-up questions) skip the network entirely
+    return _project_rows(await _cached_graph_get(url, params), fields)
 
-    if effective_status:
-        params['effective_status'] = json.dumps(effective_status)
 
-    if is_completed is not None:
-        params['is_completed'] = is_completed
+async def get_all_campaigns_by_adaccount(
+    fields: Optional[List[str]] = None,
+    filtering: Optional[List[dict]] = None,
+    date_preset: Optional[str] = None,
+    time_range: Optional[Dict[str, str]] = None,
+    updated_since: Optional[int] = None,
+    effective_status: Optional[List[str]] = None,
+    is_completed: Optional[bool] = None,
+    special_ad_categories: Optional[List[str]] = None,
+    objective: Optional[List[str]] = None,
+    buyer_guarantee_agreement_status: Optional[List[str]] = None,
+    date_format: Optional[str] = None,
+    include_drafts: Optional[bool] = None,
+    page_size: int = 100,
+    max_pages: int = 50
+) -> Dict:
+    """Retrieves every campaign in the ad account by walking pagination.
 
-    if special_ad_categories:
-        params['special_ad_categories'] = json.dumps(special_ad_categories)
+    Pages are requested at the Graph maximum of 100 rows and read through
+    the streaming helper, so a full-account walk costs ceil(N/100)
+    round-trips with roughly one page of memory in flight. The walk is
+    sequential because each 'after' cursor is only known once its page
+    arrives.
 
-    if objective:
-        params['objective'] = json.dumps(objective)
+    Args:
+        fields (Optional[List[str]]): Specific fields to retrieve for each campaign.
+        filtering (Optional[List[dict]]): Filter objects with 'field', 'operator', and 'value' keys.
+        date_preset (Optional[str]): Predefined relative date range.
+        time_range (Optional[Dict[str, str]]): Custom time range with 'since' and 'until' dates.
+        updated_since (Optional[int]): Return campaigns updated since this Unix timestamp.
+        effective_status (Optional[List[str]]): Filter by effective status.
+        is_completed (Optional[bool]): If True, returns only completed campaigns.
+        special_ad_categories (Optional[List[str]]): Filter by special ad categories.
+        objective (Optional[List[str]]): Filter by advertising objective.
+        buyer_guarantee_agreement_status (Optional[List[str]]): Filter by buyer guarantee status.
+        date_format (Optional[str]): Format for date responses ('U', 'Y-m-d H:i:s', or None).
+        include_drafts (Optional[bool]): If True, includes draft campaigns.
+        page_size (int): Rows requested per page (default: 100, the Graph maximum).
+        max_pages (int): Safety cap on pages fetched (default: 50).
 
-    if buyer_guarantee_agreement_status:
-        params['buyer_guarantee_agreement_status'] = json.dumps(buyer_guarantee_agreement_status)
+    Returns:
+        Dict: Dictionary with the merged 'data' list and the final page's
+        'paging' info.
+    """
+    act_id = get_act_id()
+    if not act_id:
+        raise ValueError(
+            "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
+        )
 
-    if date_format:
-        params['date_format'] = date_format
+    url = _CAMPAIGNS_URL_TPL.format(act_id)
+    params = _prepare_params(
+        {'access_token': get_access_token(), 'limit': page_size},
+        fields=fields,
+        filtering=filtering,
+        date_preset=date_preset,
+        time_range=time_range,
+        updated_since=updated_since,
+        effective_status=effective_status,
+        is_completed=is_completed,
+        special_ad_categories=special_ad_categories,
+        objective=objective,
+        buyer_guarantee_agreement_status=buyer_guarantee_agreement_status,
+        date_format=date_format,
+        include_drafts=include_drafts
+    )
 
-    if include_drafts is not None:
-        params['include_drafts'] = include_drafts
+    merged: List[Any] = []
+    page = None
+    for _ in range(max_pages):
+        page = await _make_graph_api_call_stream(url, params)
+        merged.extend(page.get('data', []))
+        paging = page.get('paging', {})
+        after = paging.get('cursors', {}).get('after')
+        if not after or 'next' not in paging:
+            break
+        params['after'] = after
 
-    return await _make_graph_api_call(url, params)
+    result = {'data': merged}
+    if page and 'paging' in page:
+        result['paging'] = page['paging']
+    return _project_rows(result, fields)
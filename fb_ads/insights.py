@@ -5,16 +5,207 @@ This module provides tools for retrieving performance insights and analytics
 for ad accounts, campaigns, ad sets, and ads.
 """
 
-from typing import List, Optional, Dict, Any
+import asyncio
+import dataclasses
+import logging
+import os
+import random
+import time
+from urllib.parse import urlencode
+
 import httpx
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
 from .api import (
     FB_GRAPH_URL,
+    _loads,
     get_access_token,
     get_act_id,
+    _get_http_client,
     _make_graph_api_call,
-    _build_insights_params
+    _make_graph_api_batch,
+    _build_insights_params,
+    _insights_query_params,
+    _read_cache_key,
+    InsightsQuery
 )
 
+logger = logging.getLogger(__name__)
+
+# Served when a caller doesn't name fields. Graph's own default set
+# includes heavy action arrays (~20 action types × attribution windows
+# per row); these four cover the common "how is it doing" question at a
+# fraction of the payload, and callers opt into more explicitly.
+_DEFAULT_INSIGHTS_FIELDS = ['impressions', 'clicks', 'spend', 'ctr']
+
+
+# Insights for a fixed query are stable for minutes, so merged results are
+# served from a short TTL cache (seconds; FB_INSIGHTS_CACHE_TTL overrides,
+# 0 disables). Kept in-process like the api module's read cache — a disk
+# cache would add I/O and staleness handling for no benefit in a
+# long-running server.
+_INSIGHTS_CACHE_TTL = float(os.environ.get("FB_INSIGHTS_CACHE_TTL", "60"))
+_INSIGHTS_CACHE: Dict[Any, Tuple[float, Dict]] = {}
+_INSIGHTS_CACHE_MAX = 256
+
+# Single-flight map: identical queries arriving while a walk is already
+# in progress await the same task instead of firing duplicate request
+# chains. Complements the TTL cache — this layer collapses same-instant
+# duplicates, the cache handles near-past ones.
+_INFLIGHT: Dict[Any, "asyncio.Task[Dict]"] = {}
+
+# Graph API application/account rate-limit error codes, delivered as
+# HTTP 400 rather than 429, so the transport-level retry never sees them
+_THROTTLE_CODES = frozenset({4, 17, 32, 613, 80000, 80004})
+_THROTTLE_ATTEMPTS = 6
+
+
+def _is_throttled(e: httpx.HTTPStatusError) -> bool:
+    """True when a response is a Graph rate-limit error worth backing off on."""
+    if e.response.status_code != 400:
+        return False
+    try:
+        body = _loads(e.response.content)
+    except Exception:
+        return False
+    return body.get('error', {}).get('code') in _THROTTLE_CODES
+
+
+async def _page_with_throttle_retry(fetch: Callable[[], Awaitable[Dict]]) -> Dict:
+    """Run a single page fetch, backing off on Graph throttling errors.
+
+    Retries the same page with exponential backoff plus jitter so a
+    throttled page 7 of a long walk does not force the caller to restart
+    from page 1. Non-throttle errors and exhausted attempts propagate.
+    """
+    for attempt in range(_THROTTLE_ATTEMPTS):
+        try:
+            return await fetch()
+        except httpx.HTTPStatusError as e:
+            if not _is_throttled(e) or attempt == _THROTTLE_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(min(2 ** attempt + random.random(), 60.0))
+
+
+async def _paginate(url: str, params: Dict[str, Any], max_pages: int = 25) -> Dict:
+    """Fetch an insights page and transparently walk 'paging.next'.
+
+    Insights cursors are opaque and each 'next' URL is only known once its
+    predecessor arrives, so the walk is sequential; the pooled client
+    keeps every hop on the same warm connection. Stops after max_pages as
+    a safety cap and returns one merged 'data' list with the final page's
+    'paging' info. Throttled pages are retried in place; if the rate
+    limit persists, already-fetched rows are returned with a
+    '_partial': True sentinel and 'paging' pointing at the failed page
+    so the caller can resume instead of restarting from page 1.
+    """
+    page = await _page_with_throttle_retry(lambda: _make_graph_api_call(url, params))
+    next_url = page.get('paging', {}).get('next')
+    if not next_url:
+        return page
+
+    merged = list(page.get('data', []))
+    client = _get_http_client()
+    pages_fetched = 1
+
+    async def _fetch_next(page_url: str) -> Dict:
+        # Streaming keeps only one copy of each page body in memory while
+        # downloading; large breakdown reports easily run to megabytes
+        chunks = []
+        async with client.stream("GET", page_url) as response:
+            if response.is_error:
+                # Buffer the error body before raising: streamed responses
+                # are unread at this point, and _is_throttled needs the
+                # Graph error payload off the exception
+                await response.aread()
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+        return _loads(b"".join(chunks))
+
+    while next_url and pages_fetched < max_pages:
+        try:
+            next_page = await _page_with_throttle_retry(
+                lambda u=next_url: _fetch_next(u)
+            )
+        except httpx.HTTPStatusError as e:
+            if not _is_throttled(e):
+                raise
+            # Rate limit outlasted every retry: hand back what was fetched
+            # (with the previous page's 'paging' still pointing at the
+            # failed URL) rather than discarding completed pages
+            partial = {'data': merged, '_partial': True}
+            if 'paging' in page:
+                partial['paging'] = page['paging']
+            return partial
+        page = next_page
+        merged.extend(page.get('data', []))
+        next_url = page.get('paging', {}).get('next')
+        pages_fetched += 1
+
+    result = {'data': merged}
+    if 'paging' in page:
+        result['paging'] = page['paging']
+    return result
+
+
+async def _cached_paginate(url: str, params: Dict[str, Any]) -> Dict:
+    """Serve a full paginated insights read from the TTL cache when fresh,
+    deduplicating concurrent identical reads.
+
+    Keys match the api read cache (url plus sorted params minus the
+    access token). Only cursor-free reads come through here, so cached
+    entries always represent a complete merged walk.
+    """
+    key = _read_cache_key(url, params)
+    now = time.monotonic()
+
+    if _INSIGHTS_CACHE_TTL > 0:
+        hit = _INSIGHTS_CACHE.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+    inflight = _INFLIGHT.get(key)
+    if inflight is not None:
+        return await inflight
+
+    task = asyncio.ensure_future(_paginate(url, params))
+    _INFLIGHT[key] = task
+    try:
+        data = await task
+    finally:
+        _INFLIGHT.pop(key, None)
+
+    if _INSIGHTS_CACHE_TTL > 0 and not data.get('_partial'):
+        if len(_INSIGHTS_CACHE) >= _INSIGHTS_CACHE_MAX:
+            # Drop expired entries first; if nothing expired, start fresh
+            live = {k: v for k, v in _INSIGHTS_CACHE.items() if v[0] > now}
+            _INSIGHTS_CACHE.clear()
+            if len(live) < _INSIGHTS_CACHE_MAX:
+                _INSIGHTS_CACHE.update(live)
+        _INSIGHTS_CACHE[key] = (now + _INSIGHTS_CACHE_TTL, data)
+    return data
+
+
+async def _get_insights(entity_id: str, query: InsightsQuery) -> Dict:
+    """Shared implementation behind the four public insights functions.
+
+    The entity ID (an 'act_'-prefixed ad account, campaign, ad set or ad)
+    selects the Graph node; everything else rides in the query object.
+    Explicit cursor/offset use keeps single-page semantics; otherwise
+    every page is walked and merged before returning.
+    """
+    if query.fields is None:
+        logger.debug(
+            f"No insights fields requested for {entity_id}; "
+            f"defaulting to {_DEFAULT_INSIGHTS_FIELDS}"
+        )
+        query = dataclasses.replace(query, fields=_DEFAULT_INSIGHTS_FIELDS)
+    url = f"{FB_GRAPH_URL}/{entity_id}/insights"
+    params = _insights_query_params({'access_token': get_access_token()}, query)
+    if query.after or query.before or query.offset:
+        return await _make_graph_api_call(url, params)
+    return await _cached_paginate(url, params)
+
 
 async def get_adaccount_insights(
     fields: Optional[List[str]] = None,
@@ -47,17 +238,16 @@ async def get_adaccount_insights(
     various options for filtering, time breakdowns, and attribution settings. Note that
     some metrics returned might be estimated or in development.
 
-    CRITICAL: This function MUST automatically fetch ALL pages using pagination.
-    When the response contains a 'paging.next' URL, IMMEDIATELY and AUTOMATICALLY
-    use the facebook_fetch_pagination_url tool to fetch the next page. Continue
-    this process until no 'next' URL exists. Do NOT ask the user for permission
-    to continue pagination. Do NOT stop after the first page. Always return the
-    complete consolidated list of ALL ad accounts across all pages in a single
-    response. This is a requirement, not optional behavior.
+    Pagination is handled internally: unless an explicit 'after'/'before'
+    cursor or 'offset' is supplied, every page is fetched and merged into a
+    single consolidated 'data' list before returning, so callers do not
+    need to walk 'paging.next' themselves.
 
     Args:
         fields (Optional[List[str]]): A list of specific metrics and fields to retrieve.
-            If omitted, a default set is returned by the API. Common examples include:
+            If omitted, a lean client-side default of 'impressions', 'clicks', 'spend'
+            and 'ctr' is requested (not the API's much larger default set; ask for
+            additional fields explicitly if needed). Common examples include:
                 - 'account_currency', 'account_id', 'account_name'
                 - 'actions', 'clicks', 'conversions'
                 - 'cpc', 'cpm', 'cpp', 'ctr'
@@ -145,13 +335,7 @@ async def get_adaccount_insights(
             print("Fetched next page results.")
         ```
     """
-    act_id = get_act_id()
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{act_id}/insights"
-    params = {'access_token': access_token}
-
-    params = _build_insights_params(
-        params,
+    query = InsightsQuery(
         fields=fields,
         date_preset=date_preset,
         time_range=time_range,
@@ -175,8 +359,7 @@ async def get_adaccount_insights(
         until=until,
         locale=locale
     )
-
-    return await _make_graph_api_call(url, params)
+    return await _get_insights(get_act_id(), query)
 
 
 async def get_campaign_insights(
@@ -213,6 +396,8 @@ async def get_campaign_insights(
     Args:
         campaign_id (str): The ID of the target Facebook ad campaign, e.g., '23843xxxxx'.
         fields (Optional[List[str]]): A list of specific metrics and fields to retrieve.
+            If omitted, a lean client-side default of 'impressions', 'clicks', 'spend'
+            and 'ctr' is requested (not the API's much larger default set).
             Common examples: 'campaign_name', 'account_id', 'impressions', 'clicks',
             'spend', 'ctr', 'reach', 'actions', 'objective', 'cost_per_action_type',
             'conversions', 'cpc', 'cpm', 'cpp', 'frequency', 'date_start', 'date_stop'.
@@ -273,15 +458,10 @@ async def get_campaign_insights(
             next_page_results = await fetch_pagination_url(url=next_page_url)
         ```
     """
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{campaign_id}/insights"
-    params = {'access_token': access_token}
-
     # Default level to 'campaign' if not provided for this specific tool
     effective_level = level if level else 'campaign'
 
-    params = _build_insights_params(
-        params,
+    query = InsightsQuery(
         fields=fields,
         date_preset=date_preset,
         time_range=time_range,
@@ -305,8 +485,7 @@ async def get_campaign_insights(
         until=until,
         locale=locale
     )
-
-    return await _make_graph_api_call(url, params)
+    return await _get_insights(campaign_id, query)
 
 
 async def get_adset_insights(
@@ -343,7 +522,9 @@ async def get_adset_insights(
 
     Args:
         adset_id (str): The ID of the target ad set, e.g., '6123456789012'.
-        fields (Optional[List[str]]): A list of specific metrics and fields. Common examples:
+        fields (Optional[List[str]]): A list of specific metrics and fields. If omitted,
+            a lean client-side default of 'impressions', 'clicks', 'spend' and 'ctr' is
+            requested (not the API's much larger default set). Common examples:
             'adset_name', 'campaign_name', 'account_id', 'impressions', 'clicks', 'spend',
             'ctr', 'reach', 'frequency', 'actions', 'conversions', 'cpc', 'cpm', 'cpp',
             'cost_per_action_type', 'video_p25_watched_actions', 'website_purchases'.
@@ -397,15 +578,10 @@ async def get_adset_insights(
             next_page_results = await fetch_pagination_url(url=next_page_url)
         ```
     """
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{adset_id}/insights"
-    params = {'access_token': access_token}
-
     # Default level to 'adset' if not provided for this specific tool
     effective_level = level if level else 'adset'
 
-    params = _build_insights_params(
-        params,
+    query = InsightsQuery(
         fields=fields,
         date_preset=date_preset,
         time_range=time_range,
@@ -429,8 +605,7 @@ async def get_adset_insights(
         until=until,
         locale=locale
     )
-
-    return await _make_graph_api_call(url, params)
+    return await _get_insights(adset_id, query)
 
 
 async def get_ad_insights(
@@ -467,7 +642,9 @@ async def get_ad_insights(
 
     Args:
         ad_id (str): The ID of the target ad (ad group), e.g., '6123456789012'.
-        fields (Optional[List[str]]): A list of specific metrics and fields. Common examples:
+        fields (Optional[List[str]]): A list of specific metrics and fields. If omitted,
+            a lean client-side default of 'impressions', 'clicks', 'spend' and 'ctr' is
+            requested (not the API's much larger default set). Common examples:
             'ad_name', 'adset_name', 'campaign_name', 'account_id', 'impressions', 'clicks',
             'spend', 'ctr', 'cpc', 'cpm', 'cpp', 'reach', 'frequency', 'actions', 'conversions',
             'cost_per_action_type', 'inline_link_clicks', 'inline_post_engagement', 'unique_clicks',
@@ -531,15 +708,10 @@ async def get_ad_insights(
             next_page = await fetch_pagination_url(url=next_page_url)
         ```
     """
-    access_token = get_access_token()
-    url = f"{FB_GRAPH_URL}/{ad_id}/insights"
-    params = {'access_token': access_token}
-
     # Default level to 'ad' if not provided for this specific tool
     effective_level = level if level else 'ad'
 
-    params = _build_insights_params(
-        params,
+    query = InsightsQuery(
         fields=fields,
         date_preset=date_preset,
         time_range=time_range,
@@ -563,8 +735,69 @@ async def get_ad_insights(
         until=until,
         locale=locale
     )
+    return await _get_insights(ad_id, query)
+
+
+async def get_insights_batch(requests: List[Dict[str, Any]]) -> List[Dict]:
+    """Fetch insights for many objects in as few HTTP round-trips as possible.
+
+    Instead of issuing one HTTPS request per entity, the queries ride the
+    Graph batch endpoint in chunks of up to 50 sub-requests per call.
+
+    Args:
+        requests (List[Dict[str, Any]]): One spec per entity. Each spec
+            must include 'object_id' (an 'act_'-prefixed ad account ID,
+            or a campaign/ad set/ad ID); every other key is forwarded to
+            the insights parameter builder, e.g. 'fields', 'level',
+            'date_preset', 'time_range', 'breakdowns', 'filtering',
+            'limit'.
 
-    return await _make_graph_api_call(url, params)
+    Returns:
+        List[Dict]: Insights payloads aligned with the input specs.
+        Entries that could not be fetched carry an 'error' key instead.
+
+    Example:
+        ```python
+        results = await get_insights_batch([
+            {"object_id": cid, "fields": ["impressions", "spend"],
+             "date_preset": "last_7d", "level": "campaign"}
+            for cid in campaign_ids
+        ])
+        ```
+    """
+    results: List[Dict] = [{} for _ in requests]
+    subrequests: List[Dict[str, str]] = []
+    positions: List[int] = []
+
+    for i, spec in enumerate(requests):
+        spec = dict(spec)
+        object_id = spec.pop('object_id', None)
+        if not object_id:
+            results[i] = {'error': "Each batch entry needs an 'object_id'"}
+            continue
+        # Same lean default as the single-entity path
+        spec.setdefault('fields', _DEFAULT_INSIGHTS_FIELDS)
+        try:
+            params = _build_insights_params({}, **spec)
+        except TypeError as e:
+            results[i] = {'error': f"Invalid insights parameters for '{object_id}': {e}"}
+            continue
+        suffix = f"?{urlencode(params)}" if params else ""
+        subrequests.append({
+            'method': 'GET',
+            'relative_url': f"{object_id}/insights{suffix}"
+        })
+        positions.append(i)
+
+    if subrequests:
+        responses = await _make_graph_api_batch(subrequests)
+        for i, response in zip(positions, responses):
+            if response is None:
+                results[i] = {'error': 'Empty response from batch sub-request'}
+            else:
+                results[i] = response
+
+    return results
 
 
 async def fetch_pagination_url(url: str) -> Dict:
@@ -589,8 +822,18 @@ async def fetch_pagination_url(url: str) -> Dict:
             prev_page_data = await fetch_pagination_url(url=initial_results["paging"]["previous"])
         ```
     """
-    # This function takes a full URL which already includes the access token
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.get(url)
-    response.raise_for_status()
-    return response.json()
+    # This function takes a full URL which already includes the access token.
+    # Goes through the shared pooled client so pagination walks reuse the
+    # same TLS connection as the initial insights call; the body is
+    # streamed so only one copy sits in memory while downloading.
+    client = _get_http_client()
+    chunks = []
+    async with client.stream("GET", url) as response:
+        if response.is_error:
+            # Streamed bodies are unread when raise_for_status fires;
+            # buffer first so the exception carries the error payload
+            await response.aread()
+        response.raise_for_status()
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+    return _loads(b"".join(chunks))
@@ -5,10 +5,10 @@ This module provides helper functions for ad targeting, including interest searc
 region resolution, and pixel management.
 """
 
-import json
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from .api import (
     FB_GRAPH_URL,
+    _dump,
     get_access_token,
     get_act_id,
     _make_graph_api_call
@@ -19,7 +19,7 @@ async def search_ad_interests(
     query: str,
     limit: Optional[int] = 25,
     locale: str = "pt_BR"
-) -> str:
+) -> Dict[str, Any]:
     """Search for Facebook ad interests by keyword.
 
     This function searches the Facebook ad targeting database for interests that match
@@ -32,7 +32,7 @@ async def search_ad_interests(
             Other options: "en_US", "es_ES", etc.
 
     Returns:
-        str: JSON string containing matching interests with their IDs, names, and metadata.
+        Dict: Matching interests with their IDs, names, and metadata.
 
     Example:
         ```python
@@ -54,7 +54,7 @@ async def search_ad_interests(
         ```
     """
     if not query:
-        return json.dumps({"error": "No search query provided"}, indent=2)
+        return {"error": "No search query provided"}
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/search"
@@ -68,43 +68,22 @@ async def search_ad_interests(
     }
 
     try:
-        data = await _make_graph_api_call(url, params)
-
-        # Process results to ensure proper unicode handling
-        if 'data' in data:
-            processed_data = []
-            for interest in data['data']:
-                # Ensure all string fields are properly decoded
-                processed_interest = {}
-                for key, value in interest.items():
-                    if isinstance(value, str):
-                        # Properly handle unicode characters
-                        processed_interest[key] = value.encode('utf-8').decode('utf-8')
-                    elif isinstance(value, list):
-                        # Handle path array with unicode
-                        processed_interest[key] = [
-                            item.encode('utf-8').decode('utf-8') if isinstance(item, str) else item
-                            for item in value
-                        ]
-                    else:
-                        processed_interest[key] = value
-                processed_data.append(processed_interest)
-
-            data['data'] = processed_data
-
-        return json.dumps(data, indent=2, ensure_ascii=False)
+        # Returned as-is; the MCP layer serializes tool results once at
+        # the wire, so there is no dump/re-parse round-trip here
+        return await _make_graph_api_call(url, params)
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to search ad interests",
             "details": str(e),
             "query": query
-        }, indent=2, ensure_ascii=False)
+        }
 
 
 async def get_region_key_for_adsets(
     region_name: str,
-    country_code: str = "BR"
-) -> str:
+    country_code: str = "BR",
+    include_all: bool = False
+) -> Dict[str, Any]:
     """Get the region key for Brazilian states or other regions to use in ad set targeting.
 
     This function resolves region names (like state names) to their Facebook targeting keys.
@@ -113,9 +92,12 @@ async def get_region_key_for_adsets(
     Args:
         region_name (str): Name of the region/state (e.g., "São Paulo", "Rio de Janeiro", "Minas Gerais")
         country_code (str): ISO country code. Default: "BR" (Brazil)
+        include_all (bool): Include every match under 'all_matches' in the result.
+            Default: False — most callers only need the best match's 'key', and
+            the full match list can double the payload size.
 
     Returns:
-        str: JSON string containing the region key and metadata, or error message.
+        Dict: The region key and metadata, or an error payload.
 
     Example:
         ```python
@@ -151,7 +133,7 @@ async def get_region_key_for_adsets(
         - Bahia: "3471"
     """
     if not region_name:
-        return json.dumps({"error": "No region name provided"}, indent=2)
+        return {"error": "No region name provided"}
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/search"
@@ -159,7 +141,7 @@ async def get_region_key_for_adsets(
     params = {
         'access_token': access_token,
         'type': 'adgeolocation',
-        'location_types': json.dumps(['region']),
+        'location_types': _dump(['region'], pretty=False),
         'q': region_name,
         'country_code': country_code
     }
@@ -180,31 +162,32 @@ async def get_region_key_for_adsets(
                 "country_name": best_match.get('country_name'),
                 "supports_region": best_match.get('supports_region', True),
                 "supports_city": best_match.get('supports_city', False),
-                "all_matches": data['data']  # Include all matches for reference
             }
+            if include_all:
+                result["all_matches"] = data['data']  # All matches for reference
 
-            return json.dumps(result, indent=2, ensure_ascii=False)
+            return result
         else:
-            return json.dumps({
+            return {
                 "error": "No matching region found",
                 "region_name": region_name,
                 "country_code": country_code,
                 "suggestion": "Try using the full state name or check spelling"
-            }, indent=2, ensure_ascii=False)
+            }
 
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to get region key",
             "details": str(e),
             "region_name": region_name,
             "country_code": country_code
-        }, indent=2, ensure_ascii=False)
+        }
 
 
 async def list_pixels(
     fields: Optional[List[str]] = None,
     limit: Optional[int] = 25
-) -> str:
+) -> Dict[str, Any]:
     """List all Meta Pixels associated with an ad account.
 
     This function retrieves all pixels that are available for use with the specified ad account.
@@ -224,7 +207,7 @@ async def list_pixels(
         limit (Optional[int]): Maximum number of pixels to return. Default: 25.
 
     Returns:
-        str: JSON string containing pixel information or error message.
+        Dict: Pixel information, or an error payload.
 
     Example:
         ```python
@@ -246,9 +229,9 @@ async def list_pixels(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
+        return {
             "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup."
-        }, indent=2)
+        }
 
     access_token = get_access_token()
     url = f"{FB_GRAPH_URL}/{act_id}/adspixels"
@@ -264,11 +247,10 @@ async def list_pixels(
     }
 
     try:
-        data = await _make_graph_api_call(url, params)
-        return json.dumps(data, indent=2)
+        return await _make_graph_api_call(url, params)
     except Exception as e:
-        return json.dumps({
+        return {
             "error": "Failed to list pixels",
             "details": str(e),
             "act_id": act_id
-        }, indent=2)
+        }
@@ -5,10 +5,10 @@ This module provides name-based search functions that combine entity retrieval
 with performance insights for comprehensive analysis.
 """
 
-import json
 from typing import List, Optional, Dict, Any
 from .api import (
     FB_GRAPH_URL,
+    _dump,
     get_access_token,
     get_act_id,
     _make_graph_api_call,
@@ -102,7 +102,7 @@ async def fetch_campaigns_by_name(
         campaigns_params = {
             'access_token': access_token,
             'fields': ','.join(fields),
-            'filtering': json.dumps(name_filter),
+            'filtering': _dump(name_filter, pretty=False),
             'limit': limit
         }
 
@@ -263,7 +263,7 @@ async def fetch_adsets_by_name(
         adsets_params = {
             'access_token': access_token,
             'fields': ','.join(fields),
-            'filtering': json.dumps(name_filter),
+            'filtering': _dump(name_filter, pretty=False),
             'limit': limit
         }
 
@@ -405,7 +405,7 @@ async def fetch_objects_by_name(
     """
     act_id = get_act_id()
     if not act_id:
-        return json.dumps({
+        return _dump({
             "error": "Ad account ID not configured. Set --facebook-ads-ad-account-id at server startup.",
             "data": [],
             "summary": {
@@ -418,10 +418,10 @@ async def fetch_objects_by_name(
                 "adsets_count": 0,
                 "objects_with_insights": 0
             }
-        }, indent=2)
+        })
 
     if not object_names:
-        return json.dumps({
+        return _dump({
             "data": [],
             "summary": {
                 "requested_names": [],
@@ -433,7 +433,7 @@ async def fetch_objects_by_name(
                 "adsets_count": 0,
                 "objects_with_insights": 0
             }
-        }, indent=2)
+        })
 
     if not insights_fields:
         insights_fields = [
@@ -500,4 +500,4 @@ async def fetch_objects_by_name(
         }
     }
 
-    return json.dumps(result, indent=2)
+    return _dump(result)
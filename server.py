@@ -165,6 +165,29 @@ async def facebook_get_campaign_by_id(
     return await campaigns.get_campaign_by_id(campaign_id, fields, date_format)
 
 
+@mcp.tool()
+async def facebook_get_campaigns_by_ids(
+    campaign_ids: List[str],
+    fields: Optional[List[str]] = None,
+    date_format: Optional[str] = None
+) -> Dict:
+    """Retrieves detailed information about multiple campaigns in one call.
+
+    The lookups run concurrently, so fetching many campaigns costs about
+    as much as fetching one.
+
+    Args:
+        campaign_ids (List[str]): Campaign IDs to retrieve information for.
+        fields (Optional[List[str]]): A list of specific fields to retrieve for each campaign.
+        date_format (Optional[str]): Format for date responses ('U', 'Y-m-d H:i:s', or None).
+
+    Returns:
+        Dict: Dictionary where keys are campaign IDs and values are campaign
+        details (or an error payload for IDs that failed).
+    """
+    return await campaigns.get_campaigns_by_ids(campaign_ids, fields, date_format)
+
+
 @mcp.tool()
 async def facebook_get_campaigns_by_adaccount(
     fields: Optional[List[str]] = None,
@@ -213,6 +236,35 @@ async def facebook_get_campaigns_by_adaccount(
     )
 
 
+@mcp.tool()
+async def facebook_get_all_campaigns_by_adaccount(
+    fields: Optional[List[str]] = None,
+    filtering: Optional[List[dict]] = None,
+    effective_status: Optional[List[str]] = None,
+    date_format: Optional[str] = None,
+    max_pages: int = 50
+) -> Dict:
+    """Retrieves every campaign in the ad account, following pagination automatically.
+
+    Args:
+        fields (Optional[List[str]]): A list of specific fields to retrieve for each campaign.
+        filtering (Optional[List[dict]]): Filter objects with 'field', 'operator', and 'value' keys.
+        effective_status (Optional[List[str]]): Filter by effective status.
+        date_format (Optional[str]): Format for date responses ('U', 'Y-m-d H:i:s', or None).
+        max_pages (int): Safety cap on pages fetched (default: 50, 100 campaigns per page).
+
+    Returns:
+        Dict: A dictionary with the merged 'data' list covering all pages.
+    """
+    return await campaigns.get_all_campaigns_by_adaccount(
+        fields=fields,
+        filtering=filtering,
+        effective_status=effective_status,
+        date_format=date_format,
+        max_pages=max_pages
+    )
+
+
 # ==============================================================================
 # AD SET TOOLS (6 tools)
 # ==============================================================================
@@ -275,6 +327,23 @@ async def facebook_create_adset(
     )
 
 
+@mcp.tool()
+async def facebook_create_adsets_bulk(
+    adsets: List[Dict[str, Any]]
+) -> str:
+    """Create multiple ad sets in a single batched Graph API call.
+
+    Args:
+        adsets (List[Dict[str, Any]]): One dict per ad set using the same
+            keys as facebook_create_adset (campaign_id, name,
+            optimization_goal, billing_event, plus optional parameters).
+
+    Returns:
+        str: JSON string containing a per-ad-set result list or error message.
+    """
+    return await adsets.create_adsets_bulk(adsets)
+
+
 @mcp.tool()
 async def facebook_update_adset(
     adset_id: str,
@@ -353,14 +422,16 @@ async def facebook_get_adsets_by_ids(
 async def facebook_get_adsets_by_adaccount(
     fields: Optional[List[str]] = None,
     filtering: Optional[List[dict]] = None,
-    limit: Optional[int] = 25,
+    limit: Optional[int] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
     date_preset: Optional[str] = None,
     time_range: Optional[Dict[str, str]] = None,
     updated_since: Optional[int] = None,
     effective_status: Optional[List[str]] = None,
-    date_format: Optional[str] = None
+    date_format: Optional[str] = None,
+    auto_paginate: bool = False,
+    max_pages: int = 10
 ) -> str:
     """Retrieves ad sets from a specific Facebook ad account.
 
@@ -368,6 +439,7 @@ async def facebook_get_adsets_by_adaccount(
         fields (Optional[List[str]]): A list of specific fields to retrieve.
         filtering (Optional[List[dict]]): Filter objects.
         limit (Optional[int]): Maximum number of ad sets to return per page.
+            Defaults to 25, or 100 when auto_paginate is set.
         after (Optional[str]): Pagination cursor for the next page.
         before (Optional[str]): Pagination cursor for the previous page.
         date_preset (Optional[str]): Predefined relative date range.
@@ -375,13 +447,16 @@ async def facebook_get_adsets_by_adaccount(
         updated_since (Optional[int]): Return ad sets updated since this Unix timestamp.
         effective_status (Optional[List[str]]): Filter by effective status.
         date_format (Optional[str]): Format for date responses.
+        auto_paginate (bool): Follow pagination cursors and merge all pages.
+        max_pages (int): Page cap when auto_paginate is set.
 
     Returns:
         str: JSON string containing the requested ad sets or error message.
     """
     return await adsets.get_adsets_by_adaccount(
         fields, filtering, limit, after, before, date_preset,
-        time_range, updated_since, effective_status, date_format
+        time_range, updated_since, effective_status, date_format,
+        auto_paginate=auto_paginate, max_pages=max_pages
     )
 
 
@@ -390,11 +465,13 @@ async def facebook_get_adsets_by_campaign(
     campaign_id: str,
     fields: Optional[List[str]] = None,
     filtering: Optional[List[dict]] = None,
-    limit: Optional[int] = 25,
+    limit: Optional[int] = None,
     after: Optional[str] = None,
     before: Optional[str] = None,
     effective_status: Optional[List[str]] = None,
-    date_format: Optional[str] = None
+    date_format: Optional[str] = None,
+    auto_paginate: bool = False,
+    max_pages: int = 10
 ) -> str:
     """Retrieves ad sets from a specific Facebook campaign.
 
@@ -403,17 +480,21 @@ async def facebook_get_adsets_by_campaign(
         fields (Optional[List[str]]): A list of specific fields to retrieve.
         filtering (Optional[List[dict]]): Filter objects.
         limit (Optional[int]): Maximum number of ad sets to return per page.
+            Defaults to 25, or 100 when auto_paginate is set.
         after (Optional[str]): Pagination cursor for the next page.
         before (Optional[str]): Pagination cursor for the previous page.
         effective_status (Optional[List[str]]): Filter by effective status.
         date_format (Optional[str]): Format for date responses.
+        auto_paginate (bool): Follow pagination cursors and merge all pages.
+        max_pages (int): Page cap when auto_paginate is set.
 
     Returns:
         str: JSON string containing the requested ad sets or error message.
     """
     return await adsets.get_adsets_by_campaign(
         campaign_id, fields, filtering, limit, after, before,
-        effective_status, date_format
+        effective_status, date_format,
+        auto_paginate=auto_paginate, max_pages=max_pages
     )
 
 
@@ -560,6 +641,25 @@ async def facebook_get_ad_by_id(
     return await ads.get_ad_by_id(ad_id, fields, date_format)
 
 
+@mcp.tool()
+async def facebook_get_ads_by_ids(
+    ad_ids: List[str],
+    fields: Optional[List[str]] = None,
+    date_format: Optional[str] = None
+) -> str:
+    """Retrieves detailed information about multiple Facebook ads by their IDs.
+
+    Args:
+        ad_ids (List[str]): List of ad IDs to retrieve.
+        fields (Optional[List[str]]): A list of specific fields to retrieve.
+        date_format (Optional[str]): Format for date responses.
+
+    Returns:
+        str: JSON string containing the requested ads information or error message.
+    """
+    return await ads.get_ads_by_ids(ad_ids, fields, date_format)
+
+
 @mcp.tool()
 async def facebook_get_ads_by_adaccount(
     fields: Optional[List[str]] = None,
@@ -688,7 +788,7 @@ async def facebook_search_ad_interests(
     query: str,
     limit: Optional[int] = 25,
     locale: str = "pt_BR"
-) -> str:
+) -> Dict:
     """Search for Facebook ad interests by keyword.
 
     Args:
@@ -697,7 +797,7 @@ async def facebook_search_ad_interests(
         locale (str): Locale for search results. Default: "pt_BR" (Brazilian Portuguese).
 
     Returns:
-        str: JSON string containing matching interests with their IDs, names, and metadata.
+        Dict: Matching interests with their IDs, names, and metadata.
     """
     return await meta_utils.search_ad_interests(query, limit, locale)
 
@@ -705,25 +805,27 @@ async def facebook_search_ad_interests(
 @mcp.tool()
 async def facebook_get_region_key_for_adsets(
     region_name: str,
-    country_code: str = "BR"
-) -> str:
+    country_code: str = "BR",
+    include_all: bool = False
+) -> Dict:
     """Get the region key for Brazilian states or other regions to use in ad set targeting.
 
     Args:
         region_name (str): Name of the region/state (e.g., "São Paulo", "Rio de Janeiro")
         country_code (str): ISO country code. Default: "BR" (Brazil)
+        include_all (bool): Include every match under 'all_matches'. Default: False.
 
     Returns:
-        str: JSON string containing the region key and metadata, or error message.
+        Dict: The region key and metadata, or an error payload.
     """
-    return await meta_utils.get_region_key_for_adsets(region_name, country_code)
+    return await meta_utils.get_region_key_for_adsets(region_name, country_code, include_all)
 
 
 @mcp.tool()
 async def facebook_list_pixels(
     fields: Optional[List[str]] = None,
     limit: Optional[int] = 25
-) -> str:
+) -> Dict:
     """List all Meta Pixels associated with an ad account.
 
     Args:
@@ -731,7 +833,7 @@ async def facebook_list_pixels(
         limit (Optional[int]): Maximum number of pixels to return. Default: 25.
 
     Returns:
-        str: JSON string containing pixel information or error message.
+        Dict: Pixel information, or an error payload.
     """
     return await meta_utils.list_pixels(fields, limit)
 
@@ -819,7 +921,8 @@ async def facebook_get_adaccount_insights(
     """Retrieves performance insights for a specified Facebook ad account.
 
     Args:
-        fields (Optional[List[str]]): List of specific metrics to retrieve.
+        fields (Optional[List[str]]): List of specific metrics to retrieve. If omitted,
+            a lean default of 'impressions', 'clicks', 'spend' and 'ctr' is requested.
         date_preset (str): Predefined relative time range. Default: 'last_30d'.
         time_range (Optional[Dict[str, str]]): Specific time range.
         time_ranges (Optional[List[Dict[str, str]]]): Array of time ranges.
@@ -885,7 +988,8 @@ async def facebook_get_campaign_insights(
 
     Args:
         campaign_id (str): The ID of the target campaign.
-        fields (Optional[List[str]]): List of specific metrics to retrieve.
+        fields (Optional[List[str]]): List of specific metrics to retrieve. If omitted,
+            a lean default of 'impressions', 'clicks', 'spend' and 'ctr' is requested.
         date_preset (str): Predefined relative time range. Default: 'last_30d'.
         time_range (Optional[Dict[str, str]]): Specific time range.
         time_ranges (Optional[List[Dict[str, str]]]): Array of time ranges.
@@ -951,7 +1055,8 @@ async def facebook_get_adset_insights(
 
     Args:
         adset_id (str): The ID of the target ad set.
-        fields (Optional[List[str]]): List of specific metrics to retrieve.
+        fields (Optional[List[str]]): List of specific metrics to retrieve. If omitted,
+            a lean default of 'impressions', 'clicks', 'spend' and 'ctr' is requested.
         date_preset (str): Predefined relative time range. Default: 'last_30d'.
         time_range (Optional[Dict[str, str]]): Specific time range.
         time_ranges (Optional[List[Dict[str, str]]]): Array of time ranges.
@@ -1017,7 +1122,8 @@ async def facebook_get_ad_insights(
 
     Args:
         ad_id (str): The ID of the target ad.
-        fields (Optional[List[str]]): List of specific metrics to retrieve.
+        fields (Optional[List[str]]): List of specific metrics to retrieve. If omitted,
+            a lean default of 'impressions', 'clicks', 'spend' and 'ctr' is requested.
         date_preset (str): Predefined relative time range. Default: 'last_30d'.
         time_range (Optional[Dict[str, str]]): Specific time range.
         time_ranges (Optional[List[Dict[str, str]]]): Array of time ranges.
@@ -1053,6 +1159,27 @@ async def facebook_get_ad_insights(
     )
 
 
+@mcp.tool()
+async def facebook_get_insights_batch(requests: List[Dict[str, Any]]) -> List[Dict]:
+    """Retrieves insights for multiple objects in a single batched call.
+
+    Coalesces many insights queries (mixed accounts, campaigns, ad sets,
+    ads) into Graph API batch requests instead of one HTTPS call each.
+
+    Args:
+        requests (List[Dict[str, Any]]): One spec per entity. Each spec must
+            include 'object_id' (an 'act_'-prefixed ad account ID, or a
+            campaign/ad set/ad ID); other keys such as 'fields', 'level',
+            'date_preset', 'time_range', 'breakdowns', 'filtering' and
+            'limit' are forwarded to the insights query.
+
+    Returns:
+        List[Dict]: Insights payloads aligned with the input specs. Failed
+        entries carry an 'error' key instead.
+    """
+    return await insights.get_insights_batch(requests)
+
+
 @mcp.tool()
 async def facebook_fetch_pagination_url(url: str) -> Dict:
     """Fetch data from a Facebook Graph API pagination URL.
@@ -1146,6 +1273,11 @@ def main():
     except Exception as e:
         logger.error(f"Failed to start server: {e}")
         raise
+    finally:
+        # Release the pooled HTTP connections on shutdown
+        import asyncio
+        from fb_ads.api import close_http_client
+        asyncio.run(close_http_client())
 
 
 if __name__ == "__main__":